@@ -45,7 +45,9 @@ def list_perf_event_log_files(data_dir: Path):
                     an empty list is returned. Additionally, an error message is printed if no matching
                     files are found in the directory.
     """
-    csv_files = list(data_dir.glob("**/*.csv"))
+    # Match the suffix in the pattern, so the directory walk skips other CSV files (e.g. decisions.csv)
+    # without building Path objects for them
+    csv_files = list(data_dir.glob("**/*perf_event_log.csv"))
 
     # Filter CSV files that end with "perf_event_log"
     perf_event_log_files = [file for file in csv_files if file.stem.endswith("perf_event_log")]
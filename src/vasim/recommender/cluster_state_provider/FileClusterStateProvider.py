@@ -46,6 +46,10 @@ Methods:
     process_data(data=None):
         Processes the list of CSV files provided and constructs a `DataFrame` containing CPU usage data.
 
+    read_perf_event_logs(csv_paths, features=("cpu",), logger=None):
+        Module-level function that reads perf event log CSV files into a single `DataFrame`. It backs
+        `process_data` and can be used without a provider instance, e.g. to load data once and share it.
+
     truncate_data(recorded_data, last_decision_time):
         Limits the recorded data to the defined time window, ensuring that decisions are only made
         based on the valid subset of data.
@@ -56,9 +60,11 @@ Methods:
     get_total_cpu():
         Retrieves the total CPU limit for the cluster, based on the maximum allowed CPU configuration.
 """
+import functools
 import logging
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
 
 import pandas as pd
@@ -117,7 +123,9 @@ class FileClusterStateProvider(ClusterStateProvider):
         self.logger = logging.getLogger()
 
         self.data_dir = Path(data_dir) or Path().absolute() / "data"
-        if not list_perf_event_log_files(self.data_dir):
+        # Data that was already loaded from data_dir (see SimulatedBaseClusterStateProvider) proves the csvs exist,
+        # so the directory is only scanned when there is none
+        if kwargs.get("preloaded_data") is None and not list_perf_event_log_files(self.data_dir):
             self.logger.error("Error: no csvs found in data_dir %s", self.data_dir)
             raise SystemExit(f"Error: no csvs found in data_dir {self.data_dir}")
 
@@ -212,20 +220,7 @@ class FileClusterStateProvider(ClusterStateProvider):
     def process_data(self, data=None):
         assert data is not None, "No data provided to process"
         assert isinstance(data, list), "Data must be a list"
-        csv_paths = data
-        recorded_data = pd.DataFrame()
-        for csv_path in csv_paths:
-            path = str(csv_path)
-            try:
-                temp_data = pd.read_csv(path)
-                temp_data["cpu"] = temp_data["CPU_USAGE_ACTUAL"]
-                temp_data["time"] = temp_data["TIMESTAMP"].apply(lambda x: datetime.strptime(x, "%Y.%m.%d-%H:%M:%S:%f"))
-                temp_data = temp_data[["time"] + self.features]
-                recorded_data = pd.concat([recorded_data, temp_data], axis=0)
-            except Exception as e:  # pylint: disable=broad-exception-caught  # FIXME
-                self.logger.error("Error reading %s", path, exc_info=e)
-                continue
-        return recorded_data
+        return read_perf_event_logs(data, self.features, self.logger)
 
     def truncate_data(self, recorded_data, last_decision_time):
         end_time = recorded_data["time"].iloc[-1]
@@ -237,8 +232,15 @@ class FileClusterStateProvider(ClusterStateProvider):
                 return None, None
 
         start_time = end_time - timedelta(minutes=self.config.general_config["window"])
-        recorded_data = recorded_data[recorded_data["time"] >= start_time]
-        recorded_data = recorded_data[recorded_data["time"] <= end_time]
+        # Build a single mask, so the frame is filtered once instead of twice. For tz-naive datetimes the
+        # comparison runs directly on the underlying datetime64 array, skipping the pandas Series machinery.
+        times = recorded_data["time"]
+        if pd.api.types.is_datetime64_dtype(times):
+            times = times.to_numpy()
+            in_window = (times >= pd.Timestamp(start_time).to_datetime64()) & (times <= pd.Timestamp(end_time).to_datetime64())
+        else:
+            in_window = times.between(start_time, end_time)
+        recorded_data = recorded_data[in_window]
         return recorded_data, end_time
 
     def get_last_decision_time(self, recorded_data):
@@ -273,3 +275,115 @@ class FileClusterStateProvider(ClusterStateProvider):
     def get_total_cpu(self):
         # TODO: this function makes less sense in the context of the simulator
         return self.config.general_config["max_cpu_limit"]
+
+
+# Files above this size are memory-mapped while parsing, so their pages are read on demand from the page cache
+MEMORY_MAP_MIN_BYTES = 64 * 1024 * 1024
+# Number of rows parsed at a time, which bounds the memory taken by the raw columns of a large file
+CHUNK_ROWS = 1_000_000
+# Maximum number of threads used to parse several perf event log files at once
+MAX_READ_WORKERS = 8
+
+
+def read_perf_event_logs(csv_paths, features=("cpu",), logger=None, use_cache=True):
+    """
+    Read the perf event log CSV files into a single DataFrame with a `time` column and the requested features.
+
+    Several files are parsed in parallel threads. Files that cannot be read are logged and skipped. By default the
+    parsed data of each file is cached by its path, modification time and size (see `_read_perf_event_log`), so
+    files that did not change since the previous call are not parsed again. Callers that cache the returned frame
+    themselves pass `use_cache=False`, so the data is not kept in memory twice.
+
+    Args:
+        csv_paths (list): The perf event log CSV files to read.
+        features (Sequence[str]): The feature columns to keep next to `time`.
+        logger (logging.Logger, optional): Logger used to report unreadable files. Defaults to the root logger.
+        use_cache (bool): Whether to use and fill the per-file cache. Defaults to True.
+
+    Returns:
+        pd.DataFrame: The concatenated data of all readable files, or an empty DataFrame if none could be read.
+    """
+    logger = logger or logging.getLogger()
+    features = tuple(features)
+    paths = [str(csv_path) for csv_path in csv_paths]
+
+    def load(path):
+        try:
+            stat = os.stat(path)
+            if use_cache:
+                return _read_perf_event_log(path, stat.st_mtime_ns, stat.st_size, features)
+            return _parse_perf_event_log(path, stat.st_size, features)
+        except Exception as e:  # pylint: disable=broad-exception-caught  # FIXME
+            return e
+
+    max_workers = min(MAX_READ_WORKERS, os.cpu_count() or 1, len(paths))
+    if max_workers > 1:
+        # The C parser releases the GIL while tokenizing, so threads parse several files at once
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(load, paths))
+    else:
+        results = [load(path) for path in paths]
+
+    # Collect the frames and concatenate once, since concatenating per file copies all earlier rows every time
+    frames = []
+    for path, result in zip(paths, results):
+        if isinstance(result, Exception):
+            logger.error("Error reading %s", path, exc_info=result)
+            continue
+        frames.extend(result)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=0)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_perf_event_log(path, mtime_ns, size, features):
+    """
+    Parse a single perf event log CSV file and cache the result.
+
+    `mtime_ns` is only part of the cache key, so a rewritten file is parsed again. Failures are not cached.
+
+    Args:
+        path (str): The perf event log CSV file to read.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        size (int): The size of the file in bytes.
+        features (tuple): The feature columns to keep next to `time`.
+
+    Returns:
+        tuple: The parsed chunks of the file as DataFrames. Callers must not modify them in place.
+    """
+    # pylint: disable=unused-argument
+    return _parse_perf_event_log(path, size, features)
+
+
+def _parse_perf_event_log(path, size, features):
+    """
+    Parse a single perf event log CSV file.
+
+    The file is parsed in chunks of `CHUNK_ROWS` rows and only the needed columns are kept, so the raw timestamp
+    strings of a large file are never all in memory at once. Files larger than `MEMORY_MAP_MIN_BYTES` are
+    memory-mapped while parsing instead of being read through a file buffer.
+
+    Args:
+        path (str): The perf event log CSV file to read.
+        size (int): The size of the file in bytes.
+        features (tuple): The feature columns to keep next to `time`.
+
+    Returns:
+        tuple: The parsed chunks of the file as DataFrames.
+    """
+    columns = ["time", *features]
+    needed_columns = {"TIMESTAMP", "CPU_USAGE_ACTUAL", *features}
+    chunks = []
+    with pd.read_csv(
+        path,
+        usecols=lambda column: column in needed_columns,
+        chunksize=CHUNK_ROWS,
+        memory_map=size > MEMORY_MAP_MIN_BYTES,
+    ) as reader:
+        for temp_data in reader:
+            temp_data["cpu"] = temp_data["CPU_USAGE_ACTUAL"]
+            # Parse the whole column at once with the known format instead of calling strptime per row
+            temp_data["time"] = pd.to_datetime(temp_data["TIMESTAMP"], format="%Y.%m.%d-%H:%M:%S:%f")
+            chunks.append(temp_data[columns])
+    return tuple(chunks)
@@ -16,8 +16,8 @@ Description:
 
 Decorators:
     timeit(func):
-        A decorator to measure the execution time of a function. Outputs the duration in seconds
-        after the function has completed execution.
+        A decorator to measure the execution time of a function. Logs the duration in seconds at DEBUG
+        level after the function has completed execution.
 
 Classes:
     DataProcessor:
@@ -37,10 +37,10 @@ Methods:
     DataProcessor.prepare_data(y, smooth_window=1, smooth=True, test_size=0.2):
         Prepares time series data for forecasting by applying optional smoothing and performing train/test splits.
 
-    DataProcessor.resample_dataframe(df, freq):
+    DataProcessor.resample_dataframe(df, freq, agg="mean"):
         Resamples the input DataFrame to a specified frequency, applying forward-filling to handle missing data.
 
-    DataProcessor.get_workload_duration(data):
+    DataProcessor.get_workload_duration(data, assume_sorted=False):
         Calculates the total duration of a workload based on the time range in the input DataFrame.
 
 Parameters:
@@ -68,6 +68,9 @@ Parameters:
     freq (str):
         The frequency for resampling the data.
 
+    agg (str):
+        The aggregation applied within each resampling bin.
+
     data (pd.DataFrame):
         Input DataFrame containing a 'time' column for calculating the workload duration.
 
@@ -76,10 +79,15 @@ Returns:
     resampled DataFrame, or workload duration.
 """
 
+import functools
+import logging
+import math
 import time
 
+import numpy as np
 import pandas as pd
-from sktime.forecasting.model_selection import temporal_train_test_split
+
+logger = logging.getLogger(__name__)
 
 
 def timeit(func):
@@ -93,11 +101,12 @@ def timeit(func):
         function: The wrapped function with execution time measurement.
     """
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        end = time.time()
-        print(f"{func.__name__} execution time: {end - start:.5f} seconds")
+        end = time.perf_counter()
+        logger.debug("%s execution time: %.5fs", func.__name__, end - start)
         return result
 
     return wrapper
@@ -122,10 +131,10 @@ class DataProcessor:
             Prepares the time series data by applying optional smoothing and splitting it into
             training and testing sets.
 
-        resample_dataframe(df, freq):
+        resample_dataframe(df, freq, agg="mean"):
             Resamples the input DataFrame to the specified frequency and forward-fills missing data.
 
-        get_workload_duration(data):
+        get_workload_duration(data, assume_sorted=False):
             Calculates the total duration of a workload based on the time range in the input DataFrame.
     """
 
@@ -154,17 +163,20 @@ class DataProcessor:
         Splits the time series into training and testing sets.
 
         This method splits the input time series data into training and testing sets
-        using a specified test size proportion.
+        using a specified test size proportion. The split is chronological: the test set is
+        the last `ceil(test_size * len(series))` points, matching sktime's `temporal_train_test_split`.
 
         Args:
             series (pd.Series): The input data series to be split.
-            test_size (float): The proportion of the data to include in the test set.
+            test_size (float): The proportion of the data to include in the test set. An int is
+                taken as the absolute number of test points.
 
         Returns:
             tuple: A tuple containing the training and testing sets.
         """
-        y_train, y_test = temporal_train_test_split(series, test_size=test_size)
-        return y_train, y_test
+        num_test = test_size if isinstance(test_size, int) else math.ceil(test_size * len(series))
+        split = len(series) - num_test
+        return series.iloc[:split], series.iloc[split:]
 
     @staticmethod
     def prepare_data(y, smooth_window=1, smooth=True, test_size=0.2):
@@ -183,14 +195,23 @@ class DataProcessor:
         Returns:
             tuple: A tuple containing the smoothed training and testing sets.
         """
-        y_train, y_test = DataProcessor.train_test_split(y, test_size=test_size)
-        if smooth:
-            y_train = DataProcessor.smooth_max(y_train, smooth_window, center=False)
-            y_test = DataProcessor.smooth_max(y_test, smooth_window, center=False)
+        if not smooth:
+            return DataProcessor.train_test_split(y, test_size=test_size)
+
+        # Smooth the whole series in one rolling pass and split afterwards. The two halves are smoothed
+        # independently, so the first `smooth_window - 1` test points must not see the training data:
+        # those few points are re-smoothed from the test half alone.
+        y_train, y_test = DataProcessor.train_test_split(
+            DataProcessor.smooth_max(y, smooth_window, center=False), test_size=test_size
+        )
+        num_head = min(smooth_window - 1, len(y_test))
+        if num_head > 0:
+            y_test = y_test.copy()
+            y_test.iloc[:num_head] = DataProcessor.smooth_max(y.iloc[len(y_train) : len(y_train) + num_head], smooth_window)
         return y_train, y_test
 
     @staticmethod
-    def resample_dataframe(df, freq):
+    def resample_dataframe(df, freq, agg="mean"):
         """
         Resamples the DataFrame to the specified frequency.
 
@@ -200,17 +221,21 @@ class DataProcessor:
         Args:
             df (pd.DataFrame): The input DataFrame to be resampled.
             freq (str): The new frequency to resample to (e.g., '1T' for 1-minute intervals).
+            agg (str): How the values within each bin are aggregated (default is "mean"). Use "max" when the
+                result is fed into a rolling maximum such as `smooth_max`.
 
         Returns:
             pd.DataFrame: The resampled DataFrame with missing data forward-filled.
         """
         df = df.set_index("time")
-        df.index = pd.to_datetime(df.index)
-        df = df.resample(freq).mean().ffill()
+        # The time column is usually parsed on ingest already; only convert when it is not.
+        if not pd.api.types.is_datetime64_any_dtype(df.index):
+            df.index = pd.to_datetime(df.index)
+        df = df.resample(freq).agg(agg).ffill()
         return df
 
     @staticmethod
-    def get_workload_duration(data):
+    def get_workload_duration(data, assume_sorted=False):
         """
         Calculates the duration of the workload.
 
@@ -220,11 +245,13 @@ class DataProcessor:
 
         Args:
             data (pd.DataFrame): The input DataFrame containing a 'time' column.
+            assume_sorted (bool): If True, the 'time' column must be sorted ascending and only the first
+                and last timestamps are read. Otherwise the range is computed in a single pass.
 
         Returns:
             timedelta: The total duration of the workload.
         """
-        min_time = data["time"].min()
-        max_time = data["time"].max()
-        diff = max_time - min_time
-        return diff
+        times = data["time"]
+        if assume_sorted:
+            return pd.Timedelta(times.iat[-1] - times.iat[0])
+        return pd.Timedelta(np.ptp(times.to_numpy()))
@@ -25,15 +25,19 @@ Classes:
     and runs the specified autoscaling algorithms.
 
 Functions:
-    main: A command-line interface for running the InMemoryRunnerSimulator.
+    main: A command-line interface for running the InMemoryRunnerSimulator. With `--sweep_dir`, every
+    config file in that directory is simulated in parallel worker processes.
 
 Dependencies:
     argparse, json, logging, numpy, pandas, and other modules for cluster state simulation and analysis.
 """
 
 import argparse
+import copy
+import functools
 import json
 import logging
+import multiprocessing
 import os
 from pathlib import Path
 
@@ -49,7 +53,7 @@ from vasim.simulator.analysis.plot_utils import (
     calculate_and_return_metrics_to_target,
     plot_cpu_usage_and_new_limit_plotnine,
 )
-from vasim.simulator.ParameterTuning import create_uuid
+from vasim.simulator.ParameterTuning import create_uuid, tune_with_strategy
 from vasim.simulator.SimulatedClusterStateProviderFactory import (
     SimulatedClusterStateProviderFactory,
 )
@@ -70,6 +74,7 @@ class InMemoryRunnerSimulator:
         recommender_algorithm (object): The selected autoscaling algorithm.
         infra_scaler (SimulatedInfraScaler): The infrastructure scaler responsible for applying CPU limit changes.
         target_simulation_dir (str): Directory to save the simulation output and logs.
+        output_format (str): Format of the recorded performance data written at the end ("csv" or "parquet").
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -83,6 +88,7 @@ class InMemoryRunnerSimulator:
         config=None,
         target_simulation_dir=None,
         if_resample=True,
+        output_format="csv",
     ):
         """
         Initializes the `InMemoryRunnerSimulator` with necessary parameters to simulate autoscaling decisions.
@@ -95,7 +101,11 @@ class InMemoryRunnerSimulator:
             config (ClusterStateConfig, optional): A pre-loaded configuration object. Defaults to None.
             target_simulation_dir (str, optional): Directory to save simulation output. Defaults to None.
             if_resample (bool, optional): Flag to determine if data resampling is applied. Defaults to True.
+            output_format (str, optional): Format of the recorded performance data written at the end of the
+                simulation, "csv" or "parquet". Defaults to "csv".
         """
+        if output_format not in ("csv", "parquet"):
+            raise ValueError(f"Unknown output format: {output_format}")
         worker_id = create_uuid()
         target_simulation_dir = target_simulation_dir or os.path.join(
             f"{data_dir}_simulations",
@@ -117,9 +127,20 @@ class InMemoryRunnerSimulator:
         self.infra_scaler = self._create_infra_scaler()
         self.target_simulation_dir = target_simulation_dir or data_dir
         self.if_resample = if_resample
+        self.output_format = output_format
         self.recommender_algorithm = self._create_recommender_algorithm(algorithm)
 
-        self.out_file = self._initialize_output_file(target_simulation_dir or data_dir)
+        # Scaling decisions are buffered in memory and written once the simulation ends, see `_finalize_decisions`.
+        self.out_filename = f"{target_simulation_dir or data_dir}/decisions.csv"  # TODO: remove hardcode.
+        self._decisions = []
+
+        # Bound when a run starts, see `_bind_step_callables`.
+        self._get_next_recorded_data = None
+        self._get_current_cpu_limit = None
+        self._advance_time = None
+        self._run_recommender = None
+        self._scale = None
+        self._log_step_info = False
 
         self.sleep_interval_minutes = self.config.general_config["lag"]
 
@@ -158,7 +179,13 @@ class InMemoryRunnerSimulator:
         Returns:
             ClusterStateConfig: The configuration object loaded from the file.
         """
-        return ClusterStateConfig(filename=config_path)
+        try:
+            config_dict = _read_config_dict(str(config_path), os.path.getmtime(config_path))
+        except (OSError, ValueError):
+            # Let ClusterStateConfig log and raise the error for a missing or malformed file.
+            return ClusterStateConfig(filename=config_path)
+        # The simulation mutates its config, so each runner gets its own copy of the cached dict.
+        return ClusterStateConfig(config_dict=copy.deepcopy(config_dict))
 
     @staticmethod
     def _create_cluster_state_provider(data_dir, config, target_simulation_dir=None):
@@ -224,32 +251,11 @@ class InMemoryRunnerSimulator:
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
 
-    @staticmethod
-    def _initialize_output_file(data_dir):
-        """
-        Initializes the file where scaling decisions will be logged.
-
-        Args:
-            data_dir (str): Directory where the output decision file will be saved.
-
-        Returns:
-            file (File): The opened file object for logging scaling decisions.
-        """
-        out_filename = f"{data_dir}/decisions.csv"
-        out_file = Path(out_filename)
-
-        if not out_file.exists():
-            f = open(out_file, "a", encoding="utf-8")
-            f.write("LATEST_TIME,CURR_LIMIT,NEW_LIMIT\n")
-            f.flush()
-        else:
-            f = open(out_file, "a", encoding="utf-8")
-
-        return f
-
     def output_decision(self, latest_time, current_limit, new_limit):
         """
-        Logs the current and new CPU limits after each autoscaling decision.
+        Records the current and new CPU limits after each autoscaling decision.
+
+        The decision is buffered in memory; `_finalize_decisions` writes all of them to the decisions file.
 
         Args:
             latest_time (pd.Timestamp): The most recent timestamp for the data.
@@ -257,12 +263,30 @@ class InMemoryRunnerSimulator:
             new_limit (float): The new CPU limit after the decision.
         """
         if latest_time is not None:
-            to_write = f"{latest_time},{current_limit},{new_limit}\n"
-            self.out_file.write(to_write)
-            self.out_file.flush()
+            self._decisions.append((latest_time, current_limit, new_limit))
         else:
             self.logger.info("Nothing written this time due to error or lack of data")
 
+    def _finalize_decisions(self):
+        """
+        Writes the buffered scaling decisions to the decisions file in a single call.
+
+        The run loops call this from a `finally` block, so the decisions made so far are kept when a run fails.
+
+        The decisions are appended if the file already has content, e.g. from an earlier run into the same
+        directory. Otherwise the header is written first. The file is written even when no decision was made, since
+        the metrics calculation expects it to exist.
+
+        Each value is written as its `str`, as when the decisions were written one per step, so timestamps keep
+        their sub-second part and a missing limit is written as `None`.
+        """
+        with open(self.out_filename, "a", encoding="utf-8") as f:
+            # In append mode the position is the file size, so an empty or new file gets the header
+            if f.tell() == 0:
+                f.write("LATEST_TIME,CURR_LIMIT,NEW_LIMIT\n")
+            f.writelines(f"{time},{current_limit},{new_limit}\n" for time, current_limit, new_limit in self._decisions)
+        self._decisions = []
+
     def get_metrics(self, save_to_file=True):
         """
         Retrieves performance metrics from the simulation and saves them to a file if specified.
@@ -275,10 +299,8 @@ class InMemoryRunnerSimulator:
         """
         metrics = calculate_and_return_metrics_to_target(self.cluster_state_provider.data_dir, self.target_simulation_dir)
 
-        # Convert int64 to int
-        for key, value in metrics.items():
-            if isinstance(value, np.int64):
-                metrics[key] = int(value)
+        # Convert NumPy scalars (int64, float64, bool_, ...) to native Python types
+        metrics = {key: value.item() if isinstance(value, np.generic) else value for key, value in metrics.items()}
 
         # Save metrics to file if required
         if save_to_file and metrics:
@@ -305,17 +327,20 @@ class InMemoryRunnerSimulator:
         print(f"Starting simulation at {self.experiment_start_time} and continuing till {self.experiment_end_time}")
         print(f"Setting number of cores to {self.initial_cpu_limit}")
         self.cluster_state_provider.set_cpu_limit(self.initial_cpu_limit)
-
-        while (
-            self.cluster_state_provider.current_time + pd.Timedelta(minutes=self.sleep_interval_minutes)
-            < self.cluster_state_provider.end_time
-        ):
-
-            # Core simulation logic (without yielding progress)
-            self._execute_simulation_step()
+        self._precompute_windows()
+        self._bind_step_callables()
+
+        try:
+            for _ in self._time_grid_ns():
+                # Core simulation logic (without yielding progress)
+                self._execute_simulation_step()
+        finally:
+            # Write the decisions made so far even if a step raised
+            self._finalize_decisions()
+            self.infra_scaler.close()
 
         print(f"Simulation finished at {self.cluster_state_provider.current_time}")
-        self.cluster_state_provider.flush_metrics_data(f"{self.target_simulation_dir}/perf_event_log.csv")
+        self._flush_metrics_data()
 
         # Return the final metrics
         return self.get_metrics()
@@ -330,54 +355,183 @@ class InMemoryRunnerSimulator:
         print(f"Starting simulation at {self.experiment_start_time} and continuing till {self.experiment_end_time}")
         print(f"Setting number of cores to {self.initial_cpu_limit}")
         self.cluster_state_provider.set_cpu_limit(self.initial_cpu_limit)
+        self._precompute_windows()
+        self._bind_step_callables()
+
+        # The progress after each step is the simulated time elapsed once that step advanced by one lag
+        time_grid_ns = self._time_grid_ns()
+        start_ns = self.cluster_state_provider.current_time.value
+        lag_ns = pd.Timedelta(minutes=self.sleep_interval_minutes).value
+        progress_values = (time_grid_ns - start_ns + lag_ns) / (self.cluster_state_provider.end_time.value - start_ns)
+
+        try:
+            for progress in progress_values.tolist():
+                # Core simulation logic (with progress tracking)
+                self._execute_simulation_step()
+
+                # Yield the progress
+                yield progress
+        finally:
+            # Write the decisions made so far even if a step raised or the caller stopped iterating early
+            self._finalize_decisions()
+            self.infra_scaler.close()
 
-        total_time = self.cluster_state_provider.end_time - self.cluster_state_provider.current_time
-        time_elapsed = pd.Timedelta(minutes=0)
+        print(f"Simulation finished at {self.cluster_state_provider.current_time}")
+        self._flush_metrics_data()
+
+    @classmethod
+    def run_grid(cls, data_dir, lags, multipliers, config_path=None, initial_cpu_limit=None, num_workers=1):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Runs the multiplicative algorithm for every combination of `lags` and `multipliers` on the same trace.
 
-        while (
-            self.cluster_state_provider.current_time + pd.Timedelta(minutes=self.sleep_interval_minutes)
-            < self.cluster_state_provider.end_time
-        ):
+        The configurations are independent, so they are simulated in parallel worker processes by the
+        grid strategy of `tune_with_strategy`.
 
-            # Core simulation logic (with progress tracking)
-            self._execute_simulation_step()
+        Args:
+            data_dir (str): Directory where the input workload data is stored.
+            lags (List[int]): Lag values (in minutes) to try.
+            multipliers (List[float]): Multiplier values to try. The base config must define `multiplier`.
+            config_path (str, optional): Path to the base configuration file. Defaults to `{data_dir}/metadata.json`.
+            initial_cpu_limit (int, optional): Initial CPU limit for the simulations. Defaults to None.
+            num_workers (int, optional): Number of worker processes. Defaults to 1.
 
-            # Yield the progress
-            time_elapsed += pd.Timedelta(minutes=self.sleep_interval_minutes)
-            progress = time_elapsed / total_time
-            yield progress
+        Returns:
+            List[Tuple[ClusterStateConfig, dict]]: The configuration and resulting metrics of every combination.
+        """
+        return tune_with_strategy(
+            config_path or f"{data_dir}/metadata.json",
+            "grid",
+            num_workers=num_workers,
+            data_dir=data_dir,
+            algorithm="multiplicative",
+            initial_cpu_limit=initial_cpu_limit,
+            algo_specific_params_to_tune={"multiplier": list(multipliers)},
+            general_params_to_tune={"lag": list(lags)},
+        )
 
-        print(f"Simulation finished at {self.cluster_state_provider.current_time}")
-        self.cluster_state_provider.flush_metrics_data(f"{self.target_simulation_dir}/perf_event_log.csv")
+    def _flush_metrics_data(self):
+        """
+        Writes the recorded performance data to the simulation directory in the configured output format.
+
+        The Parquet file is smaller and faster to write, but the CSV file is the one the file-based cluster state
+        providers and the analysis tools read.
+        """
+        if self.output_format == "parquet":
+            self.cluster_state_provider.flush_metrics_data_parquet(f"{self.target_simulation_dir}/perf_event_log.parquet")
+        else:
+            self.cluster_state_provider.flush_metrics_data(f"{self.target_simulation_dir}/perf_event_log.csv")
+
+    def _time_grid_ns(self):
+        """
+        Returns the decision times of the simulation as int64 nanoseconds.
+
+        Every step advances the simulated time by exactly one lag, and a step is taken while one more lag still
+        fits before the end of the data. The decision times are therefore a uniform grid known before the loop
+        starts, and the number of steps is its length.
+
+        Returns:
+            np.ndarray: The decision times, from the current time of the cluster state provider.
+        """
+        lag_ns = pd.Timedelta(minutes=self.sleep_interval_minutes).value
+        start_ns = self.cluster_state_provider.current_time.value
+        end_ns = self.cluster_state_provider.end_time.value
+        return np.arange(start_ns, end_ns - lag_ns, lag_ns, dtype=np.int64)
+
+    def _precompute_windows(self):
+        """
+        Precomputes the data window of every simulation step before the main loop starts.
+
+        The decision times are known upfront (every `lag` minutes until the end of the data), so the cluster state
+        provider resolves all window bounds in one vectorized pass. Each step then slices its window by position.
+        """
+        self.cluster_state_provider.precompute_windows(self.cluster_state_provider.end_time)
+
+    def _bind_step_callables(self):
+        """
+        Binds the methods called on every simulation step once, before the main loop starts.
+
+        Whether the per-step INFO messages are enabled is also checked here rather than on every step.
+
+        This is done when the run starts rather than in `__init__`, so that components replaced after construction
+        are still the ones used.
+        """
+        self._get_next_recorded_data = self.cluster_state_provider.get_next_recorded_data
+        self._get_current_cpu_limit = self.cluster_state_provider.get_current_cpu_limit
+        self._advance_time = self.cluster_state_provider.advance_time
+        self._run_recommender = self.recommender_algorithm.run
+        self._scale = self.infra_scaler.scale
+        # The per-step trace messages are only logged at INFO level, which the runner's logger does not enable by default
+        self._log_step_info = self.logger.isEnabledFor(logging.INFO)
 
     def _execute_simulation_step(self):
         """
         Executes a single simulation step, processing the next data window and updating the CPU limit.
 
         This function is called repeatedly during the simulation to process the data and adjust the CPU limits.
+        The run loops call `_bind_step_callables` before the first step.
         """
         # Get the next window of data to simulate
-        recorded_data, latest_time = self.cluster_state_provider.get_next_recorded_data()
+        recorded_data, latest_time = self._get_next_recorded_data()
 
         if recorded_data is None:
-            self.logger.info("Waiting for window to fill with data before running simulation.")
-            self.cluster_state_provider.advance_time()
+            if self._log_step_info:
+                self.logger.info("Waiting for window to fill with data before running simulation.")
+            self._advance_time()
             return
 
         # Run user-provided algorithm with the recorded data
-        new_limit = self.recommender_algorithm.run(recorded_data)
+        new_limit = self._run_recommender(recorded_data)
 
         # Log current and new CPU limit decisions
-        self.output_decision(latest_time, self.cluster_state_provider.get_current_cpu_limit(), new_limit)
+        self.output_decision(latest_time, self._get_current_cpu_limit(), new_limit)
 
         # Advance time by the lag parameter
-        self.cluster_state_provider.advance_time()
+        self._advance_time()
 
         if new_limit is None:
-            self.logger.info("No decision made")
+            if self._log_step_info:
+                self.logger.info("No decision made")
             return
 
-        self.infra_scaler.scale(new_limit, self.cluster_state_provider.current_time)
+        self._scale(new_limit, self.cluster_state_provider.current_time)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_config_dict(config_path, _mtime):
+    """
+    Reads and parses a configuration file, caching the result.
+
+    Sweeps construct many runners from the same configuration file, so the parsed JSON is cached. The modification
+    time is part of the cache key so that an edited file is read again.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        _mtime (float): Modification time of the file, used only as part of the cache key.
+
+    Returns:
+        dict: The parsed configuration. It is shared between callers and must not be mutated.
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _run_one(config_path, data_dir=None, algorithm="multiplicative"):
+    """
+    Runs a single simulation for one configuration file.
+
+    This is a module-level function so it can be pickled and sent to the worker processes of a sweep.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        data_dir (str): Directory where the input workload data is stored.
+        algorithm (str): The name of the scaling algorithm to use.
+
+    Returns:
+        Tuple[str, dict]: The configuration path and the resulting metrics.
+    """
+    runner = InMemoryRunnerSimulator(data_dir=data_dir, algorithm=algorithm, config_path=config_path)
+    return config_path, runner.run_simulation()
 
 
 def main():
@@ -385,6 +539,8 @@ def main():
     Main entry point for the command-line interface for running the InMemoryRunnerSimulator.
 
     It accepts user inputs such as algorithm, data directory, and configuration file through command-line arguments.
+    When `--sweep_dir` is given, every `*.json` config in that directory is simulated, spread over `--workers`
+    processes. Each simulation writes to its own uniquely named target directory.
     """
     parser = argparse.ArgumentParser(description="InMemoryRunnerSimulator Command Line Interface")
     parser.add_argument(
@@ -396,9 +552,20 @@ def main():
     parser.add_argument("--data_dir", help="Path to the data directory")
     parser.add_argument("--config_path", help="Path to the config file")
     parser.add_argument("--lag", type=int, default=10, help="Lag value (default: 10)")
+    parser.add_argument("--sweep_dir", help="Directory of config files to simulate in parallel")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes for a sweep (default: 1)")
 
     args = parser.parse_args()
 
+    if args.sweep_dir:
+        config_paths = sorted(str(path) for path in Path(args.sweep_dir).glob("*.json"))
+        run_one = functools.partial(_run_one, data_dir=args.data_dir, algorithm=args.algorithm)
+        with multiprocessing.Pool(processes=args.workers) as pool:
+            # Results are reported as soon as each simulation finishes, in completion order.
+            for done, (config_path, metrics) in enumerate(pool.imap_unordered(run_one, config_paths), start=1):
+                print(f"[{done}/{len(config_paths)}] {config_path}: {metrics}")
+        return
+
     runner = InMemoryRunnerSimulator(data_dir=args.data_dir, algorithm=args.algorithm, config_path=args.config_path)
     runner.run_simulation()
 
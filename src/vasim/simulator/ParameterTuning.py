@@ -22,6 +22,10 @@ The tuning strategies include:
   of random combinations from the parameter values. This approach reduces the computational cost compared to
   grid search but may miss the optimal configuration if the search space is large and too few samples are taken.
 
+- **Sobol Search**: Like random search, it selects a specified number of combinations, but draws them from a
+  scrambled Sobol sequence. The low-discrepancy points spread over the parameter space more evenly than independent
+  random samples, so fewer samples leave large regions untested.
+
 Helper functions are also provided to modify configurations, create unique worker IDs, and run the simulator.
 
 TODO:
@@ -29,26 +33,142 @@ TODO:
     - Implement other tuning strategies, such as MLOS.
     - Add unit tests for the validation of keys in `algo_specific_params_to_tune`,
      `general_params_to_tune`, and `predictive_params_to_tune`.
-    - Write unit tests for the `starmap` used for multiprocessing to ensure proper coverage in code tests.
+    - Write unit tests for the process pool used for parallel runs to ensure proper coverage in code tests.
 """
 
 import copy
+import hashlib
 import itertools
+import json
 import logging
-import multiprocessing
+import math
 import os
 import random
 import sys
 import traceback
 import uuid
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from vasim.recommender.cluster_state_provider.ClusterStateConfig import (
     ClusterStateConfig,
 )
 
 random.seed(1234)
 
+# The simulator class used by `_tune_parameters`, set once per process by `_init_worker`.
+_RUNNER_CLASS = None
+
+
+def _sample_random_values(sections, num_combinations):
+    """
+    Draws random parameter values for each section.
+
+    Args:
+        sections (Tuple[Dict[str, List[Any]], ...]): The algorithm-specific, general and predictive parameters to tune.
+        num_combinations (int): Number of random combinations to generate.
+
+    Returns:
+        List[Tuple[Dict[str, Any], ...]]: The picked values of each section, for each combination.
+    """
+    # A generator seeded per call makes the sampled configs reproducible regardless of earlier calls
+    rng = np.random.default_rng(1234)
+
+    def sample(params_to_tune):
+        # Draw the value indices of each parameter for all combinations at once
+        picks = {
+            config_param: [values[i] for i in rng.integers(0, len(values), size=num_combinations)]
+            for config_param, values in params_to_tune.items()
+        }
+        return [{config_param: picked[i] for config_param, picked in picks.items()} for i in range(num_combinations)]
+
+    return list(zip(*(sample(section) for section in sections)))
+
+
+def _sample_sobol_values(sections, num_combinations):
+    """
+    Picks parameter values from a scrambled Sobol sequence.
+
+    Each tuned parameter is one dimension of the sequence, and each coordinate in [0, 1) is mapped to one of
+    the parameter's values. The points cover the parameter space more evenly than independent random draws.
+
+    Args:
+        sections (Tuple[Dict[str, List[Any]], ...]): The algorithm-specific, general and predictive parameters to tune.
+        num_combinations (int): Number of combinations to generate.
+
+    Returns:
+        List[Tuple[Dict[str, Any], ...]]: The picked values of each section, for each combination.
+    """
+    from scipy.stats import qmc  # pylint: disable=import-outside-toplevel
+
+    params = [
+        (section_index, config_param, values)
+        for section_index, section in enumerate(sections)
+        for config_param, values in section.items()
+    ]
+    if not params:
+        return [({}, {}, {}) for _ in range(num_combinations)]
+
+    with warnings.catch_warnings():
+        # Sobol points are best balanced for a power of 2 samples, but any count is valid here
+        warnings.simplefilter("ignore", UserWarning)
+        points = qmc.Sobol(d=len(params), seed=1234).random(num_combinations)
+
+    samples = []
+    for point in points:
+        picked = ({}, {}, {})
+        for (section_index, config_param, values), u in zip(params, point):
+            picked[section_index][config_param] = values[min(int(u * len(values)), len(values) - 1)]
+        samples.append(picked)
+    return samples
+
+
+def _sample_values(
+    strategy: str,
+    algo_specific_params_to_tune: Dict[str, List[Any]],
+    general_params_to_tune: Dict[str, List[Any]],
+    predictive_params_to_tune: Dict[str, List[Any]],
+    num_combinations: int,
+) -> List[tuple]:
+    # pylint: disable=too-many-positional-arguments
+    # pylint: disable=too-many-arguments
+    """
+    Picks the parameter values of each combination according to the tuning strategy.
+
+    Args:
+        strategy (str): The tuning strategy to use ('grid', 'random' or 'sobol').
+        algo_specific_params_to_tune (Dict[str, List[Any]]): Algorithm-specific parameters and their possible values.
+        general_params_to_tune (Dict[str, List[Any]]): General configuration parameters and their possible values.
+        predictive_params_to_tune (Dict[str, List[Any]]): Predictive configuration parameters and their possible values.
+        num_combinations (int): The number of combinations to generate for the 'random' and 'sobol' strategies.
+
+    Returns:
+        List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]: The algorithm-specific, general and predictive
+        values of each combination.
+
+    Raises:
+        ValueError: If the strategy is unknown.
+    """
+    sections = (algo_specific_params_to_tune, general_params_to_tune, predictive_params_to_tune)
+    if strategy == "grid":
+        # One lazy product over the three sections, in the same order as nesting algo > general > predictive.
+        # The parameter names are the same for every combination, so capture them once.
+        section_keys = [tuple(section) for section in sections]
+        grid = itertools.product(*(itertools.product(*section.values()) for section in sections))
+        return [
+            tuple(dict(zip(keys, combination)) for keys, combination in zip(section_keys, combinations))
+            for combinations in grid
+        ]
+    if strategy == "random":
+        return _sample_random_values(sections, num_combinations)
+    if strategy == "sobol":
+        return _sample_sobol_values(sections, num_combinations)
+    # TODO: Implement other strategies, such as MLOS.
+    raise ValueError(f"Invalid strategy: {strategy}")
+
 
 def _create_modified_configs(
     baseconfig: ClusterStateConfig,
@@ -71,8 +191,8 @@ def _create_modified_configs(
         general_params_to_tune (Dict[str, List[Any]]): General configuration parameters and their possible values to tune.
         predictive_params_to_tune (Dict[str, List[Any]]): Predictive configuration parameters and their possible values
             to tune.
-        strategy (str): The tuning strategy to use ('grid' or 'random').
-        num_combinations (int): The number of random combinations to generate for the 'random' strategy.
+        strategy (str): The tuning strategy to use ('grid', 'random' or 'sobol').
+        num_combinations (int): The number of combinations to generate for the 'random' and 'sobol' strategies.
             This parameter is ignored for the 'grid' strategy.
 
     Returns:
@@ -93,64 +213,20 @@ def _create_modified_configs(
         Returns:
             ClusterStateConfig: A modified configuration.
         """
-        modified_config = copy.deepcopy(baseconfig)
-        for param, value in algo_config_params.items():
-            modified_config["algo_specific_config"][param] = value
-        for param, value in general_config_params.items():
-            modified_config["general_config"][param] = value
-        for param, value in predictive_params.items():
-            modified_config["prediction_config"][param] = value
+        # Only the three config sections are replaced, so a shallow copy with new section dicts is enough to keep
+        # the base config untouched. Each config is pickled when it is sent to a worker, so the runs never share state.
+        modified_config = copy.copy(baseconfig)
+        modified_config["algo_specific_config"] = {**baseconfig["algo_specific_config"], **algo_config_params}
+        modified_config["general_config"] = {**baseconfig["general_config"], **general_config_params}
+        modified_config["prediction_config"] = {**baseconfig["prediction_config"], **predictive_params}
         return modified_config
 
-    def generate_random_configs(algo_params_to_tune, general_params_to_tune, predictive_params_to_tune, num_combinations):
-        """
-        Generates random configurations based on provided parameters.
-
-        Args:
-            algo_params_to_tune (Dict[str, List[Any]]): Algorithm-specific parameters to tune.
-            general_params_to_tune (Dict[str, List[Any]]): General configuration parameters to tune.
-            predictive_params_to_tune (Dict[str, List[Any]]): Predictive configuration parameters to tune.
-            num_combinations (int): Number of random combinations to generate.
-
-        Returns:
-            List[ClusterStateConfig]: A list of randomly generated configurations.
-        """
-        modified_configs = []
-        for _ in range(num_combinations):
-            algo_config = {config_param: random.choice(values) for config_param, values in algo_params_to_tune.items()}
-            general_config = {config_param: random.choice(values) for config_param, values in general_params_to_tune.items()}
-            predictive_params = {
-                predictive_param: random.choice(values) for predictive_param, values in predictive_params_to_tune.items()
-            }
-            modified_configs.append(evaluate_config(algo_config, general_config, predictive_params))
-        return modified_configs
-
-    if strategy == "grid":
-        algo_specific_params_combinations = list(itertools.product(*algo_specific_params_to_tune.values()))
-        general_config_param_combinations = list(itertools.product(*general_params_to_tune.values()))
-        predictive_param_combinations = list(itertools.product(*predictive_params_to_tune.values()))
-        modified_configs = [
-            evaluate_config(
-                dict(zip(algo_specific_params_to_tune.keys(), algo_config_combination)),
-                dict(zip(general_params_to_tune.keys(), general_config_combination)),
-                dict(zip(predictive_params_to_tune.keys(), predictive_combination)),
-            )
-            for algo_config_combination in algo_specific_params_combinations
-            for general_config_combination in general_config_param_combinations
-            for predictive_combination in predictive_param_combinations
-        ]
-    elif strategy == "random":
-        modified_configs = generate_random_configs(
-            algo_specific_params_to_tune,
-            general_params_to_tune,
-            predictive_params_to_tune,
-            num_combinations,
+    return [
+        evaluate_config(*values)
+        for values in _sample_values(
+            strategy, algo_specific_params_to_tune, general_params_to_tune, predictive_params_to_tune, num_combinations
         )
-    # TODO: Implement other strategies, such as MLOS.
-    else:
-        raise ValueError(f"Invalid strategy: {strategy}")
-
-    return modified_configs
+    ]
 
 
 def create_uuid():
@@ -165,6 +241,44 @@ def create_uuid():
     return "cfg-" + uid_str[:8] + "-" + uid_str[9:13]
 
 
+def _init_worker():
+    """
+    Imports the simulator once per worker process, before the worker runs its first task.
+
+    The import cannot be at module level, since `InMemorySimulator` imports this module.
+    """
+    global _RUNNER_CLASS  # pylint: disable=global-statement
+    # pylint: disable=import-outside-toplevel
+    # pylint: disable=cyclic-import
+    from vasim.simulator.InMemorySimulator import InMemoryRunnerSimulator
+
+    _RUNNER_CLASS = InMemoryRunnerSimulator
+
+
+def _create_sweep_id(baseconfig, params_to_tune, strategy, num_combinations, algorithm, initial_cpu_limit):
+    # pylint: disable=too-many-positional-arguments
+    # pylint: disable=too-many-arguments
+    """
+    Derives a short identifier for a tuning sweep from its inputs.
+
+    The same base configuration, parameters and strategy always give the same identifier, so rerunning a sweep
+    reuses its output directories instead of piling up new ones.
+
+    Args:
+        baseconfig (ClusterStateConfig): The base configuration of the sweep.
+        params_to_tune (Tuple[Dict[str, List[Any]], ...]): The algorithm-specific, general and predictive parameters.
+        strategy (str): The tuning strategy.
+        num_combinations (int): The number of combinations requested.
+        algorithm (str): The algorithm for the simulation.
+        initial_cpu_limit (int): The initial number of CPU cores before scaling.
+
+    Returns:
+        str: An 8 character hexadecimal identifier.
+    """
+    sweep = [baseconfig, params_to_tune, strategy, num_combinations, algorithm, initial_cpu_limit]
+    return hashlib.sha256(json.dumps(sweep, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:8]
+
+
 def _tune_parameters(config, data_dir=None, algorithm=None, initial_cpu_limit=None):
     """
     Runs the simulator with the provided configuration and returns the resulting metrics.
@@ -178,15 +292,17 @@ def _tune_parameters(config, data_dir=None, algorithm=None, initial_cpu_limit=No
     Returns:
         Tuple[ClusterStateConfig, Any]: The configuration and the resulting metrics.
     """
-    worker_id = create_uuid()
+    # `tune_with_strategy` assigns the ids up front; a config run on its own gets a random one
+    worker_id = getattr(config, "uuid", None) or create_uuid()
     setattr(config, "uuid", worker_id)
     target_dir = f"{data_dir}_tuning/target_{worker_id}"
-    os.makedirs(f"{data_dir}_tuning", exist_ok=True)
+    # The parent directory is created once by `tune_with_strategy`; makedirs only creates it here when it is missing
     os.makedirs(target_dir, exist_ok=True)
     logger = logging.getLogger(f"{config.uuid}")
     logger.setLevel(logging.ERROR)
     log_file = f"{target_dir}/error_log.txt"
-    file_handler = logging.FileHandler(log_file)
+    # The file is only opened once an error is logged, so successful runs do not hold a file descriptor
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setLevel(logging.ERROR)
     formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     file_handler.setFormatter(formatter)
@@ -195,11 +311,10 @@ def _tune_parameters(config, data_dir=None, algorithm=None, initial_cpu_limit=No
     original_stdout = sys.stdout
     logger.info("Starting tuning for configuration %s", config.uuid)
     try:
-        # pylint: disable=import-outside-toplevel
-        # pylint: disable=cyclic-import
-        from vasim.simulator.InMemorySimulator import InMemoryRunnerSimulator
+        if _RUNNER_CLASS is None:
+            _init_worker()
 
-        runner = InMemoryRunnerSimulator(
+        runner = _RUNNER_CLASS(
             data_dir=data_dir,
             algorithm=algorithm,
             initial_cpu_limit=initial_cpu_limit,
@@ -214,10 +329,30 @@ def _tune_parameters(config, data_dir=None, algorithm=None, initial_cpu_limit=No
         print(e)
         logger.error("Error in tuning parameters", exc_info=e)
         logger.error(traceback.format_exc())
+    finally:
+        # Each config gets its own logger, so drop the handler to not accumulate them in long-lived workers
+        logger.removeHandler(file_handler)
+        file_handler.close()
     sys.stdout = original_stdout
     return config, None
 
 
+def _tune_parameters_chunk(chunk):
+    """
+    Runs the simulator for a chunk of configurations in a single worker task.
+
+    Sending several configurations per task reduces the number of round trips to the worker processes. Only the
+    metrics are sent back, since the parent process already holds the configurations.
+
+    Args:
+        chunk (List[Tuple]): The `_tune_parameters` arguments of each configuration in the chunk.
+
+    Returns:
+        List[Any]: The resulting metrics of each run, in chunk order.
+    """
+    return [_tune_parameters(*params)[1] for params in chunk]
+
+
 def tune_with_strategy(
     config_path: str,
     strategy: str,
@@ -229,6 +364,8 @@ def tune_with_strategy(
     algo_specific_params_to_tune: Optional[Dict[str, List[Any]]] = None,
     general_params_to_tune: Optional[Dict[str, List[Any]]] = None,
     predictive_params_to_tune: Optional[Dict[str, List[Any]]] = None,
+    max_combinations: int = 10_000,
+    sweep_id: Optional[str] = None,
 ):
     # pylint: disable=too-many-positional-arguments
     # pylint: disable=too-many-arguments
@@ -240,8 +377,9 @@ def tune_with_strategy(
 
     Args:
         config_path (str): The path to the base configuration file.
-        strategy (str): The tuning strategy ('grid' or 'random').
-        num_combinations (int): Number of parameter combinations to generate for random strategy. Ignored for grid strategy
+        strategy (str): The tuning strategy ('grid', 'random' or 'sobol').
+        num_combinations (int): Number of parameter combinations to generate for the random and sobol strategies.
+            Ignored for grid strategy
         num_workers (int): Number of worker processes to use for parallel execution.
         data_dir (str): The directory containing simulation data.
         algorithm (str): The algorithm for the simulation.
@@ -249,9 +387,14 @@ def tune_with_strategy(
         algo_specific_params_to_tune (Dict[str, List[Any]]): Algorithm-specific parameters to tune.
         general_params_to_tune (Dict[str, List[Any]]): General parameters to tune.
         predictive_params_to_tune (Dict[str, List[Any]]): Predictive parameters to tune.
+        max_combinations (int): The largest grid to run. Larger grids raise an error before any simulation starts.
+        sweep_id (str): The prefix of the configuration ids and output directories. By default it is derived from
+            the base configuration and the tuning arguments, so the same sweep always writes to the same directories.
 
     Returns:
-        List[Tuple[ClusterStateConfig, Any]]: A list of tuples with the configuration and resulting metrics.
+        List[Tuple[ClusterStateConfig, Any]]: A list of tuples with the configuration and resulting metrics, in the
+        order the configurations were generated. When no parameters are tuned, the base configuration is run once
+        and the list holds a single result, whatever `num_combinations` is.
     """
     baseconfig = ClusterStateConfig(filename=config_path)
 
@@ -270,6 +413,19 @@ def tune_with_strategy(
     for key in predictive_params_to_tune.keys():
         assert key in baseconfig["prediction_config"], f"Invalid predictive parameter: {key}"
 
+    # Fail before starting any worker if the grid is too large to run
+    if strategy == "grid":
+        grid_size = math.prod(
+            len(values)
+            for params in (algo_specific_params_to_tune, general_params_to_tune, predictive_params_to_tune)
+            for values in params.values()
+        )
+        if grid_size > max_combinations:
+            raise ValueError(
+                f"The grid has {grid_size} combinations, more than max_combinations={max_combinations}. "
+                "Tune fewer values, raise max_combinations, or use strategy='random'."
+            )
+
     # Generate the modified configs based on the specified strategy
     modified_configs = _create_modified_configs(
         baseconfig,
@@ -280,17 +436,57 @@ def tune_with_strategy(
         num_combinations,
     )
 
+    # Without parameters to tune every generated config equals the base config, so only run it once. It still goes
+    # through a worker, which gets its own copy of the config and keeps the run's side effects out of this process.
+    if not (algo_specific_params_to_tune or general_params_to_tune or predictive_params_to_tune):
+        print("No parameters to tune, running the base configuration once...")
+        modified_configs = modified_configs[:1]
+
+    # Number the configs in generation order. The sweep prefix is stable across reruns of the same sweep, and
+    # different sweeps over the same data get different prefixes.
+    if sweep_id is None:
+        sweep_id = _create_sweep_id(
+            baseconfig,
+            (algo_specific_params_to_tune, general_params_to_tune, predictive_params_to_tune),
+            strategy,
+            num_combinations,
+            algorithm,
+            initial_cpu_limit,
+        )
+    for index, modified_config in enumerate(modified_configs):
+        setattr(modified_config, "uuid", f"cfg-{sweep_id}-{index:04d}")
+
+    # Create the parent of the per-config output directories once, rather than in every task
+    os.makedirs(f"{data_dir}_tuning", exist_ok=True)
+
     # Initialize the pool of worker processes
-    with multiprocessing.Pool(processes=num_workers) as pool:
-        # Map the tuning function to the modified configs
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker) as executor:
+        # Submit the tuning function for each of the modified configs
         param_combinations = [
             (modified_config, data_dir, algorithm, initial_cpu_limit) for modified_config in modified_configs
         ]
         print(f"Running {len(param_combinations)} configurations...")
-        results = pool.starmap(_tune_parameters, param_combinations)
+        # Send the configs in chunks, with a few chunks per worker so that uneven run times still balance out
+        chunksize = max(1, len(param_combinations) // (num_workers * 4))
+        futures = {
+            executor.submit(_tune_parameters_chunk, param_combinations[start : start + chunksize]): start
+            for start in range(0, len(param_combinations), chunksize)
+        }
+
+        # Collect the results as soon as each chunk completes, but keep them in the order of the configs
+        results = [None] * len(param_combinations)
+        done = 0
+        for future in as_completed(futures):
+            chunk_metrics = future.result()
+            start = futures[future]
+            results[start : start + len(chunk_metrics)] = zip(
+                modified_configs[start : start + len(chunk_metrics)], chunk_metrics
+            )
+            done += len(chunk_metrics)
+            print(f"[{done}/{len(results)}] configurations finished")
 
     # For debugging, you can just call one directly for now, using the first modified config
-    # TODO: the starmap isn't showing up in codecov. Write a unit test for the code above that looks like this
+    # TODO: the worker processes aren't showing up in codecov. Write a unit test for the code above that looks like this
     # (only not in a loop, maybe just for ONE modified config)
     # #  results = _tune_parameters(modified_config[0], data_dir, lag, algorithm, initial_cpu_limit)
 
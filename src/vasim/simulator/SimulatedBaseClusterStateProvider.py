@@ -27,7 +27,7 @@ Attributes:
     max_cpu_limit (int): Maximum allowable CPU limit.
     lag (int): Time lag used in decision-making.
     window (int): Window of time used to evaluate cluster performance data.
-    recorded_data (pd.DataFrame): DataFrame containing the recorded performance data.
+    recorded_data (pd.DataFrame): DataFrame containing the recorded performance data, indexed and sorted by time.
     start_time (Timestamp): Start time of the recorded data.
     end_time (Timestamp): End time of the recorded data.
     current_time (Timestamp): Current simulated time.
@@ -36,11 +36,16 @@ Attributes:
 Methods:
     __init__(data_dir="data/performance_log", window=40, decision_file_path=None, max_cpu_limit=None, lag=None, **kwargs):
         Initializes the `SimulatedBaseClusterStateProvider` with specified parameters like the data directory,
-        window size, and maximum CPU limit. Loads performance data from CSV files in the `data_dir`.
+        window size, and maximum CPU limit. Loads performance data from CSV files in the `data_dir`, unless
+        already processed data is passed as `preloaded_data`.
 
     get_next_recorded_data():
         Abstract method to be implemented by subclasses to fetch the next set of recorded data.
 
+    read_metrics_data():
+        Returns the recorded data of the current window, or None once the current time is past the end of
+        the data. Shared by the in-memory providers.
+
     set_cpu_limit(new_cpu_limit):
         Sets a new CPU limit for the cluster. Updates the scaling time if the CPU limit changes.
 
@@ -48,7 +53,11 @@ Methods:
         Returns the timestamp of the last scaling operation.
 
     print_properties():
-        Prints the properties of the instance for debugging and testing purposes.
+        Prints the properties of the instance for debugging and testing purposes. Called on initialization
+        only when debug logging is enabled.
+
+    __repr__():
+        Returns a short description of the provider with its data directory and window.
 
     get_current_cpu_limit():
         Returns the current CPU limit.
@@ -57,18 +66,32 @@ Methods:
         Returns the total maximum CPU limit for the cluster.
 
     flush_metrics_data(filename):
-        Writes the recorded data to a CSV file with a custom header.
+        Writes the recorded data to a CSV file with a custom header. The timestamps are formatted in a single
+        vectorized pass.
+
+    flush_metrics_data_parquet(filename):
+        Writes the recorded data to a Parquet file with the same column names as the CSV output.
 
     get_last_decision_time(recorded_data):
         Returns the last decision time, calculated using the current time and lag.
 
     advance_time():
         Advances the current simulated time by the specified lag value.
+
+    precompute_windows(end_time=None):
+        Computes the row bounds of every upcoming decision window in one vectorized pass, so that each
+        simulation step can slice the recorded data by position instead of by label.
+
+    _slice_by_time(start_time, end_time):
+        Returns the recorded data within a time range, locating the bounds with `searchsorted` on the int64
+        view of a sorted time index. Used by subclasses for windows that were not precomputed.
 """
 
 import logging
+from datetime import timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from vasim.commons.utils import list_perf_event_log_files
@@ -77,6 +100,27 @@ from vasim.recommender.cluster_state_provider.ClusterStateProvider import (
 )
 
 
+def _format_perf_timestamps(times):
+    """
+    Format timestamps like the perf event logs (`%Y.%m.%d-%H:%M:%S:%f`) without calling strftime per row.
+
+    numpy renders the timestamps as fixed-width ISO strings (`2023-04-02T00:09:00.000000`), which only differ
+    from the perf event log format in four separator characters. Those are replaced on the raw bytes.
+
+    Args:
+        times (np.ndarray): Timezone-naive `datetime64[ns]` values without NaT.
+
+    Returns:
+        np.ndarray: The formatted timestamps as strings.
+    """
+    iso = np.datetime_as_string(times, unit="us").astype("S26")
+    chars = iso.view(np.uint8).reshape(-1, 26)
+    chars[:, [4, 7]] = ord(".")
+    chars[:, 10] = ord("-")
+    chars[:, 19] = ord(":")
+    return iso.astype(str)
+
+
 class SimulatedBaseClusterStateProvider(ClusterStateProvider):
     """
     SimulatedBaseClusterStateProvider simulates a cluster state provider by reading performance.
@@ -91,7 +135,8 @@ class SimulatedBaseClusterStateProvider(ClusterStateProvider):
         max_cpu_limit (int): Maximum allowable CPU limit.
         lag (int): Time lag used in decision-making.
         window (int): Window of time used to evaluate cluster performance data.
-        recorded_data (pd.DataFrame): DataFrame containing the recorded performance data.
+        recorded_data (pd.DataFrame): DataFrame containing the recorded performance data, indexed and sorted
+                                      by time.
         start_time (Timestamp): Start time of the recorded data.
         end_time (Timestamp): End time of the recorded data.
         current_time (Timestamp): Current simulated time.
@@ -118,41 +163,54 @@ class SimulatedBaseClusterStateProvider(ClusterStateProvider):
             decision_file_path (str): Path to the decision log file.
             max_cpu_limit (int): Maximum allowable CPU limit.
             lag (int): Time lag used in decision-making.
-            **kwargs: Additional configuration options.
+            **kwargs: Additional configuration options. `preloaded_data` can hold the already processed
+                      performance data (as returned by `process_data`), in which case the CSV files are not read.
         """
         # pylint: disable=too-many-arguments
 
         self.logger = logging.getLogger()
         self.logger.info("SimulatedBaseClusterStateProvider init")
 
-        self.data_dir = (Path().absolute() / data_dir).absolute()
-        self.decision_file_path = (Path().absolute() / decision_file_path).absolute()
+        self.data_dir = Path(data_dir).absolute()
+        self.decision_file_path = Path(decision_file_path).absolute()
         self.curr_cpu_limit = None  # set by initial_cores_count during the first scaling
-        self.print_properties()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.print_properties()
         self.config = kwargs.get("config")
         # TODO: these did not get updated to the new config format
         self.max_cpu_limit = max_cpu_limit
         self.lag = lag
+        # The simulation steps by `lag` minutes on every iteration, so build the Timedelta once
+        self._lag_delta = pd.Timedelta(minutes=lag) if lag is not None else None
         self.window = window
 
-        csv_paths = list_perf_event_log_files(self.data_dir)
-        if not csv_paths:
-            self.logger.error("Error reading csvs from %s. Your csv_paths are empty.", self.data_dir)
-            raise FileNotFoundError(f"Error reading csvs from {self.data_dir}. Your csv_paths are empty.")
-
-        # Process data
-        # Read all data from file
-        # TODO: This is a temporary solution. We will need to read data in chunks
-        self.recorded_data = self.process_data(csv_paths)
+        preloaded_data = kwargs.get("preloaded_data")
+        if preloaded_data is not None:
+            # Shallow copy: the columns and index set below stay local to this provider, the data buffers are shared
+            self.recorded_data = preloaded_data.copy(deep=False)
+        else:
+            csv_paths = list_perf_event_log_files(self.data_dir)
+            if not csv_paths:
+                self.logger.error("Error reading csvs from %s. Your csv_paths are empty.", self.data_dir)
+                raise FileNotFoundError(f"Error reading csvs from {self.data_dir}. Your csv_paths are empty.")
+
+            # Process data
+            # Read all data from file
+            # TODO: This is a temporary solution. We will need to read data in chunks
+            self.recorded_data = self.process_data(csv_paths)
+        self.recorded_data["time"] = pd.to_datetime(self.recorded_data["time"])
+        # Index by time directly, rather than copying the column to `timeindex` and moving that into the index
+        self.recorded_data.index = pd.DatetimeIndex(self.recorded_data["time"], name="timeindex")
+        # Keep the index sorted, so that time slices are binary searches and the first and last rows are the
+        # time bounds. Files are usually already in order, in which case this is a no-op.
+        if not self.recorded_data.index.is_monotonic_increasing:
+            self.recorded_data = self.recorded_data.sort_index(kind="stable")
         self.start_time = pd.Timestamp(self.recorded_data["time"].iloc[0])
         self.end_time = pd.Timestamp(self.recorded_data["time"].iloc[-1])
-
-        self.recorded_data["time"] = pd.to_datetime(self.recorded_data["time"])
-        self.recorded_data["timeindex"] = self.recorded_data["time"]
-
-        self.recorded_data.set_index("timeindex", inplace=True)
         self.current_time = self.start_time
         self.last_scaling_time = self.start_time
+        # Maps a decision time (in ns) to the (start, stop) row positions of its window, see `precompute_windows`.
+        self._window_bounds = {}
 
     def get_next_recorded_data(self):
         """
@@ -165,6 +223,31 @@ class SimulatedBaseClusterStateProvider(ClusterStateProvider):
         """
         raise NotImplementedError()
 
+    def read_metrics_data(self):
+        """
+        Read and return the recorded performance data filtered by the current time window.
+
+        This method filters the recorded performance data based on the current time and window size.
+        If the current time exceeds the end of the data, it returns None.
+
+        Returns:
+            pd.DataFrame: The filtered performance data for the current time window.
+            None: If the current time exceeds the end of the data.
+        """
+        if self.current_time > self.end_time:
+            return None
+
+        bounds = self._window_bounds.get(pd.Timestamp(self.current_time).value)
+        if bounds is not None:
+            filtered_data = self.recorded_data.iloc[bounds[0] : bounds[1]]
+        else:
+            td_window = timedelta(minutes=self.config.general_config["window"])
+            filtered_data = self._slice_by_time(self.current_time - td_window, self.current_time)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("current_time: %s; filtered_data length: %s", self.current_time, len(filtered_data))
+        return filtered_data
+
     def set_cpu_limit(self, new_cpu_limit):
         """
         Set a new CPU limit for the cluster.
@@ -193,6 +276,15 @@ class SimulatedBaseClusterStateProvider(ClusterStateProvider):
         for key, value in vars(self).items():
             print(f"{key}: {value}")
 
+    def __repr__(self):
+        """
+        Return a short description of the provider, without formatting the recorded data.
+
+        Returns:
+            str: The class name with the data directory and window.
+        """
+        return f"<{type(self).__name__} data_dir={self.data_dir} window={self.window}>"
+
     def get_current_cpu_limit(self):
         """
         Retrieve the current CPU limit for the cluster.
@@ -215,14 +307,46 @@ class SimulatedBaseClusterStateProvider(ClusterStateProvider):
         """
         Write the recorded performance data to a CSV file with a custom header.
 
+        For the usual `time` and `cpu` columns the lines are built directly from vectorized string conversions
+        of both columns; other data goes through `DataFrame.to_csv`. Both produce the same file, with `\n` line
+        endings on every platform, and write through a 1 MiB buffer.
+
         Args:
             filename (str): The path to the file where metrics will be saved.
         """
         custom_header = "TIMESTAMP,CPU_USAGE_ACTUAL"
 
-        with open(filename, "w", encoding="utf-8") as file:
+        data = self.recorded_data
+        times = data["time"]
+        if times.dtype == np.dtype("datetime64[ns]") and not times.hasnans:
+            # Format the timestamps in one vectorized pass instead of a strftime call per row
+            timestamps = _format_perf_timestamps(times.to_numpy())
+            cpu = data["cpu"] if list(data.columns) == ["time", "cpu"] else None
+            if cpu is not None and cpu.dtype == np.float64 and not cpu.hasnans:
+                # numpy renders floats like the CSV writer does (shortest repr), so the lines can be joined directly
+                lines = (f"{t},{c}\n" for t, c in zip(timestamps.tolist(), cpu.to_numpy().astype(str).tolist()))
+                with open(filename, "w", encoding="utf-8", buffering=1 << 20, newline="") as file:
+                    file.write(custom_header + "\n")
+                    file.writelines(lines)
+                return
+            data = data.assign(time=timestamps)
+
+        with open(filename, "w", encoding="utf-8", buffering=1 << 20, newline="") as file:
             file.write(custom_header + "\n")
-            self.recorded_data.to_csv(file, index=False, date_format="%Y.%m.%d-%H:%M:%S:%f", header=False)
+            data.to_csv(file, index=False, date_format="%Y.%m.%d-%H:%M:%S:%f", header=False, lineterminator="\n")
+
+    def flush_metrics_data_parquet(self, filename):
+        """
+        Write the recorded performance data to a Parquet file.
+
+        The columns are named like the header of the CSV output and the timestamps keep their datetime type, so the
+        file can be read back without parsing. This requires a Parquet engine (pyarrow or fastparquet).
+
+        Args:
+            filename (str): The path to the file where metrics will be saved.
+        """
+        data = self.recorded_data.rename(columns={"time": "TIMESTAMP", "cpu": "CPU_USAGE_ACTUAL"})
+        data.to_parquet(filename, index=False)
 
     def get_last_decision_time(self, recorded_data=None):  # pylint: disable=unused-argument
         """
@@ -234,8 +358,81 @@ class SimulatedBaseClusterStateProvider(ClusterStateProvider):
         Returns:
             Timestamp: The last decision time.
         """
-        return pd.Timestamp(self.current_time) - pd.Timedelta(minutes=self.lag)
+        return self._current_timestamp() - self._lag_delta
 
     def advance_time(self):
         """Advance the current simulated time by the lag value."""
-        self.current_time = pd.Timestamp(self.current_time) + pd.Timedelta(minutes=self.lag)
+        self.current_time = self._current_timestamp() + self._lag_delta
+
+    def _current_timestamp(self):
+        """
+        Return the current simulated time as a `pd.Timestamp`.
+
+        The current time is normally a `pd.Timestamp` already; only other types (e.g. a `datetime` set by a
+        caller) are converted, which keeps the per-step cost of `advance_time` low.
+
+        Returns:
+            Timestamp: The current simulated time.
+        """
+        current_time = self.current_time
+        return current_time if isinstance(current_time, pd.Timestamp) else pd.Timestamp(current_time)
+
+    def precompute_windows(self, end_time=None):
+        """
+        Precompute the row bounds of every decision window from the current time up to `end_time`.
+
+        The simulation visits the decision times `current_time + k * lag`, and each step slices the recorded
+        data to `[t - window, t]`. Instead of a label-based slice per step, all window bounds are computed at
+        once with two `searchsorted` calls on the time index. `read_metrics_data` then looks up the bounds of
+        the current time and slices by position, falling back to label slicing for any other time.
+
+        Args:
+            end_time (Timestamp, optional): Last decision time to precompute. Defaults to the end of the data.
+        """
+        self._window_bounds = {}
+        index = self.recorded_data.index
+        if not index.is_monotonic_increasing:
+            # Positional bounds are only equivalent to label slicing on a sorted index.
+            return
+
+        # Work on the int64 nanosecond view of the times rather than on Timestamp objects
+        index_ns = index.asi8
+        decision_ns = pd.date_range(
+            pd.Timestamp(self.current_time), end_time or self.end_time, freq=pd.Timedelta(minutes=self.lag)
+        ).asi8
+        window_ns = pd.Timedelta(minutes=self.config.general_config["window"]).value
+        starts = np.searchsorted(index_ns, decision_ns - window_ns, side="left")
+        stops = np.searchsorted(index_ns, decision_ns, side="right")
+        self._window_bounds = dict(zip(decision_ns.tolist(), zip(starts.tolist(), stops.tolist())))
+
+    def _slice_by_time(self, start_time, end_time):
+        """
+        Return the recorded data between `start_time` and `end_time`, both inclusive.
+
+        This is equivalent to `recorded_data.loc[start_time:end_time]`, but on a sorted, timezone-naive time
+        index the bounds are found with `searchsorted` on the int64 nanosecond view of the index, avoiding the
+        label-based lookup. Any other index falls back to `.loc`.
+
+        Args:
+            start_time (Timestamp): Start of the time range.
+            end_time (Timestamp): End of the time range.
+
+        Returns:
+            pd.DataFrame: The recorded data within the time range.
+        """
+        index = self.recorded_data.index
+        start_time = pd.Timestamp(start_time)
+        end_time = pd.Timestamp(end_time)
+        if (
+            not isinstance(index, pd.DatetimeIndex)
+            or index.tz is not None
+            or start_time.tz is not None
+            or end_time.tz is not None
+            or not index.is_monotonic_increasing
+        ):
+            return self.recorded_data.loc[start_time:end_time]
+
+        index_ns = index.asi8
+        start = np.searchsorted(index_ns, start_time.value, side="left")
+        stop = np.searchsorted(index_ns, end_time.value, side="right")
+        return self.recorded_data.iloc[start:stop]
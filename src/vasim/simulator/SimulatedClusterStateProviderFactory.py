@@ -33,15 +33,30 @@ Methods:
     __init__(data_dir: str, out_filename: str, config: ClusterStateConfig):
         Initializes the factory with the data directory, output filename, and cluster state configuration.
 
+    recorded_data -> pd.DataFrame:
+        Property returning the processed performance data of `data_dir`, resolved once per factory. The data
+        is cached at module level per set of files, keyed by their paths, modification times and sizes, so
+        repeated simulations over the same data (for example during parameter tuning) read the CSV files only once.
+
     create_provider(predictive: bool) -> SimulatedBaseClusterStateProvider:
         Creates and returns an instance of `SimulatedBaseClusterStateProvider`. If `predictive` is set to True,
         it creates a `SimulatedInMemoryPredictiveClusterStateProvider`, otherwise, it creates a
-        `SimulatedInMemoryClusterStateProvider`.
+        `SimulatedInMemoryClusterStateProvider`. The cached `recorded_data` is passed to the provider.
 """
 
+import functools
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from vasim.commons.utils import list_perf_event_log_files
 from vasim.recommender.cluster_state_provider.ClusterStateConfig import (
     ClusterStateConfig,
 )
+from vasim.recommender.cluster_state_provider.FileClusterStateProvider import (
+    read_perf_event_logs,
+)
 from vasim.simulator.SimulatedBaseClusterStateProvider import (
     SimulatedBaseClusterStateProvider,
 )
@@ -53,6 +68,24 @@ from vasim.simulator.SimulatedInMemoryPredictiveClusterStateProvider import (
 )
 
 
+@functools.lru_cache(maxsize=8)
+def _load_recorded_data(csv_files: tuple) -> pd.DataFrame:
+    """
+    Read and cache the performance data of a set of CSV files.
+
+    The key holds the path, modification time and size of every file, so the data is read again whenever a
+    file is changed, added or removed.
+
+    Args:
+        csv_files (tuple): A `(path, mtime_ns, size)` tuple for each CSV file to read.
+
+    Returns:
+        pd.DataFrame: The processed performance data. Callers must not modify it in place.
+    """
+    # This cache holds the concatenated frame, so the files are not also kept in the per-file cache
+    return read_perf_event_logs([path for path, _, _ in csv_files], use_cache=False)
+
+
 class SimulatedClusterStateProviderFactory:
     """
     A factory class for creating simulated cluster state providers.
@@ -89,6 +122,38 @@ class SimulatedClusterStateProviderFactory:
         if config.prediction_config:
             self.prediction_config = config.prediction_config
             print(f"Prediction config was detected: {self.prediction_config}")
+        # Arguments shared by both kinds of providers, resolved once from the config
+        general_config = config.general_config
+        self._common_kwargs = {
+            "data_dir": data_dir,
+            "max_cpu_limit": general_config["max_cpu_limit"],
+            "decision_file_path": out_filename,
+            "lag": general_config["lag"],
+            "window": general_config["window"],
+            "min_cpu_limit": general_config["min_cpu_limit"],
+            "config": config,
+        }
+
+    @functools.cached_property
+    def recorded_data(self):
+        """
+        The processed performance data of `data_dir`, shared by the providers created by any factory.
+
+        The CSV files are listed and checked once per factory, on first access.
+
+        Returns:
+            pd.DataFrame: The cached performance data, or None if `data_dir` holds no CSV files, in which
+                          case the provider reports the missing data itself.
+        """
+        csv_paths = list_perf_event_log_files(Path(self.data_dir).absolute())
+        if not csv_paths:
+            return None
+        csv_files = []
+        for path in csv_paths:
+            stat = os.stat(path)
+            csv_files.append((str(path), stat.st_mtime_ns, stat.st_size))
+        recorded_data = _load_recorded_data(tuple(csv_files))
+        return recorded_data if not recorded_data.empty else None
 
     def create_provider(self, predictive: bool) -> SimulatedBaseClusterStateProvider:
         """
@@ -108,22 +173,6 @@ class SimulatedClusterStateProviderFactory:
         """
         if predictive:
             return SimulatedInMemoryPredictiveClusterStateProvider(
-                data_dir=self.data_dir,
-                prediction_config=self.prediction_config,
-                max_cpu_limit=self.config.general_config["max_cpu_limit"],
-                decision_file_path=self.out_filename,
-                lag=self.config.general_config["lag"],
-                window=self.config.general_config["window"],
-                min_cpu_limit=self.config.general_config["min_cpu_limit"],
-                config=self.config,
-            )
-        else:
-            return SimulatedInMemoryClusterStateProvider(
-                data_dir=self.data_dir,
-                max_cpu_limit=self.config.general_config["max_cpu_limit"],
-                decision_file_path=self.out_filename,
-                lag=self.config.general_config["lag"],
-                window=self.config.general_config["window"],
-                min_cpu_limit=self.config.general_config["min_cpu_limit"],
-                config=self.config,
+                prediction_config=self.prediction_config, preloaded_data=self.recorded_data, **self._common_kwargs
             )
+        return SimulatedInMemoryClusterStateProvider(preloaded_data=self.recorded_data, **self._common_kwargs)
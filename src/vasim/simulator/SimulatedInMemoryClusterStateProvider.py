@@ -29,12 +29,12 @@ Methods:
         Abstract method that should be implemented by subclasses to retrieve the next set of performance data.
 
     read_metrics_data():
-        Reads and returns the recorded performance data filtered by the current time window.
-        If the current time exceeds the end of the data, it returns None.
+        Inherited from `SimulatedBaseClusterStateProvider`. Reads and returns the recorded performance data
+        filtered by the current time window. If the current time exceeds the end of the data, it returns None.
 
     flush_metrics_data(filename):
-        Writes the recorded data to a CSV file with a custom header, allowing metrics to be stored
-        for further analysis or auditing.
+        Inherited from `SimulatedBaseClusterStateProvider`. Writes the recorded data to a CSV file with a
+        custom header, allowing metrics to be stored for further analysis or auditing.
 
 Parameters:
     data_dir (str):
@@ -53,8 +53,6 @@ Returns:
     for the current time window.
 """
 
-from datetime import timedelta
-
 from vasim.recommender.cluster_state_provider.FileClusterStateProvider import (
     FileClusterStateProvider,
 )
@@ -134,41 +132,3 @@ class SimulatedInMemoryClusterStateProvider(SimulatedBaseClusterStateProvider, F
             NotImplementedError: If the method is not implemented in a subclass.
         """
         raise NotImplementedError()
-
-    # pylint: disable=duplicate-code
-    def read_metrics_data(self):
-        """
-        Read and return the recorded performance data filtered by the current time window.
-
-        This method filters the recorded performance data based on the current time and window size.
-        If the current time exceeds the end of the data, it returns None.
-
-        Returns:
-            pd.DataFrame: The filtered performance data for the current time window.
-            None: If the current time exceeds the end of the data.
-        """
-        if self.current_time > self.end_time:
-            return None
-
-        td_window = timedelta(minutes=self.config.general_config["window"])
-        filtered_data = self.recorded_data.loc[self.current_time - td_window : self.current_time]
-
-        self.logger.info("current_time: %s; filtered_data length: %s", self.current_time, len(filtered_data))
-        return filtered_data
-
-    # pylint: disable=duplicate-code
-    def flush_metrics_data(self, filename):
-        """
-        Write the recorded performance data to a CSV file with a custom header.
-
-        This method writes the recorded performance data to a specified CSV file for auditing or analysis,
-        with a custom header for easy identification of the data format.
-
-        Args:
-            filename (str): Path to the file where metrics will be saved.
-        """
-        custom_header = "TIMESTAMP,CPU_USAGE_ACTUAL"
-
-        with open(filename, "w", encoding="utf-8") as file:
-            file.write(custom_header + "\n")
-            self.recorded_data.to_csv(file, index=False, date_format="%Y.%m.%d-%H:%M:%S:%f", header=False)
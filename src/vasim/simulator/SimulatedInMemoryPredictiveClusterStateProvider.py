@@ -27,20 +27,21 @@ Methods:
         CPU limits, and lag. It sets up the in-memory simulation of predictive scaling.
 
     read_metrics_data():
-        Reads and returns the recorded performance data until the current time, filtered by the window size.
-        Returns None if the current time exceeds the data end time.
+        Inherited from `SimulatedBaseClusterStateProvider`. Reads and returns the recorded performance data
+        until the current time, filtered by the window size. Returns None if the current time exceeds the
+        data end time.
 
     _get_all_performance_data():
         Returns all performance data up to the current time, including a lag adjustment. If the current time
         exceeds the end time of the data, it returns None.
 
     get_next_recorded_data():
-        Retrieves the next set of recorded performance data from the predictive file provider and returns
-        it along with the end time.
+        Bound to `PredictiveFileClusterStateProvider.get_next_recorded_data`. Retrieves the next set of recorded
+        performance data and returns it along with the end time.
 
     flush_metrics_data(filename):
-        Writes the recorded data to a CSV file with a custom header. This allows the metrics to be
-        saved for analysis or reporting.
+        Inherited from `SimulatedBaseClusterStateProvider`. Writes the recorded data to a CSV file with a
+        custom header. This allows the metrics to be saved for analysis or reporting.
 
 Parameters:
     data_dir (str):
@@ -58,7 +59,9 @@ Returns:
     The `read_metrics_data` and `_get_all_performance_data` methods return filtered DataFrames containing
     the performance data for the current window or up to the current time.
 """
-from datetime import timedelta
+import logging
+
+import pandas as pd
 
 from vasim.recommender.cluster_state_provider.PredictiveFileClusterStateProvider import (
     PredictiveFileClusterStateProvider,
@@ -84,10 +87,11 @@ class SimulatedInMemoryPredictiveClusterStateProvider(SimulatedBaseClusterStateP
         lag (int): The time lag used for predictive decision-making.
 
     Methods:
-        read_metrics_data(): Returns performance data filtered by the window.
+        read_metrics_data(): Returns performance data filtered by the window (inherited).
         _get_all_performance_data(): Returns all performance data up to the current time.
-        get_next_recorded_data(): Retrieves the next set of recorded performance data.
-        flush_metrics_data(filename): Saves the recorded performance data to a CSV file.
+        get_next_recorded_data(): Retrieves the next set of recorded performance data (bound from the predictive
+            file provider).
+        flush_metrics_data(filename): Saves the recorded performance data to a CSV file (inherited).
     """
 
     # pylint: disable=too-many-instance-attributes disable=too-many-positional-arguments
@@ -135,27 +139,6 @@ class SimulatedInMemoryPredictiveClusterStateProvider(SimulatedBaseClusterStateP
             **kwargs,
         )
 
-    def read_metrics_data(self):
-        """
-        Reads performance data filtered by the current time and window size.
-
-        This method returns the recorded performance data for the current time window, filtering
-        based on the `window` size defined in the configuration. If the current time exceeds the
-        data end time, it returns None.
-
-        Returns:
-            pd.DataFrame: The filtered performance data for the current time window.
-            None: If the current time exceeds the end time of the data.
-        """
-        if self.current_time > self.end_time:
-            return None
-
-        td_window = timedelta(minutes=self.config.general_config["window"])
-        filtered_data = self.recorded_data.loc[self.current_time - td_window : self.current_time]
-
-        self.logger.info("current_time: %s; filtered_data length: %s", self.current_time, len(filtered_data))
-        return filtered_data
-
     def _get_all_performance_data(self):
         """
         Returns all performance data up to the current time.
@@ -170,38 +153,16 @@ class SimulatedInMemoryPredictiveClusterStateProvider(SimulatedBaseClusterStateP
         if self.current_time > self.end_time:
             return None
 
-        filtered_data = self.recorded_data.loc[self.start_time : self.current_time]
-        self.logger.info("current_time: %s; filtered_data length: %s", self.current_time, len(filtered_data))
+        bounds = self._window_bounds.get(pd.Timestamp(self.current_time).value)
+        if bounds is not None:
+            filtered_data = self.recorded_data.iloc[: bounds[1]]
+        else:
+            filtered_data = self._slice_by_time(self.start_time, self.current_time)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("current_time: %s; filtered_data length: %s", self.current_time, len(filtered_data))
 
         return filtered_data
 
-    def get_next_recorded_data(self):
-        """
-        Retrieves the next set of recorded performance data.
-
-        This method fetches the next available performance data from the predictive file provider
-        and returns it along with the end time of the data.
-
-        Returns:
-            pd.DataFrame: The performance data within the window.
-            pd.Timestamp: The end time of the performance data.
-        """
-        perf_data, end_time = PredictiveFileClusterStateProvider.get_next_recorded_data(self)
-        return perf_data, end_time
-
-    # pylint: disable=duplicate-code
-    def flush_metrics_data(self, filename):
-        """
-        Writes the recorded performance data to a CSV file with a custom header.
-
-        This method allows saving the performance metrics data to a specified CSV file for further
-        analysis or reporting.
-
-        Args:
-            filename (str): The path to the CSV file where the metrics will be saved.
-        """
-        custom_header = "TIMESTAMP,CPU_USAGE_ACTUAL"
-
-        with open(filename, "w", encoding="utf-8") as file:
-            file.write(custom_header + "\n")
-            self.recorded_data.to_csv(file, index=False, date_format="%Y.%m.%d-%H:%M:%S:%f", header=False)
+    # SimulatedBaseClusterStateProvider defines an abstract get_next_recorded_data that would win in the MRO,
+    # so bind the predictive file provider's implementation directly instead of wrapping it in another frame.
+    get_next_recorded_data = PredictiveFileClusterStateProvider.get_next_recorded_data
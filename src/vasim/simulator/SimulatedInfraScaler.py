@@ -29,7 +29,7 @@ Attributes:
         The starting time of the simulation.
     recovery_time (int):
         The time in minutes it takes for the system to recover after a scaling event.
-    logger (Logger):
+    logger (LoggerAdapter):
         A logger object for logging scaling decisions and events.
 
 Methods:
@@ -47,13 +47,22 @@ Methods:
 
         Returns:
             bool: Returns True if scaling was successful, otherwise False.
+
+    close():
+        Writes the log records buffered by the scaler to the update log and closes it.
 """
 import logging
+import logging.handlers
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Number of log records buffered in memory before they are written to the update log
+LOG_BUFFER_RECORDS = 1024
+
 
 class SimulatedInfraScaler:
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """
     Simulates the infrastructure scaling process in a cluster.
 
@@ -67,7 +76,7 @@ class SimulatedInfraScaler:
         last_scaling_time (datetime): Timestamp of the last scaling event.
         start_time (datetime): The starting time of the simulation.
         recovery_time (int): Time in minutes required for recovery after a scaling event.
-        logger (Logger): A logger object to log scaling decisions and events.
+        logger (LoggerAdapter): A logger object to log scaling decisions and events.
     """
 
     def __init__(self, cluster_state_provider, start_timestamp, recovery_time):
@@ -87,12 +96,24 @@ class SimulatedInfraScaler:
         self.last_scaling_time = None
         self.start_time = start_timestamp
         self.recovery_time = recovery_time
+        # Constant for the lifetime of the scaler, so resolve them once instead of on every `scale` call
+        self._recovery_seconds = recovery_time * 60
+        self._min_cpu_limit = cluster_state_provider.config.general_config["min_cpu_limit"]
+        self._max_cpu_limit = cluster_state_provider.config.general_config["max_cpu_limit"]
 
         # Set up logging in the target path, so it will be stored with the simulation data
         log_file = Path(self.cluster_state_provider.decision_file_path).parent.joinpath("updatelog.txt")
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.DEBUG)
-        self.logger.addHandler(logging.FileHandler(log_file))
+        # The scalers of a process share the module logger. Each one tags its records and its handler only
+        # writes those, so records do not end up in the update logs of other scalers.
+        logger.setLevel(logging.DEBUG)
+        self.logger = logging.LoggerAdapter(logger, {"scaler_id": id(self)})
+        # The scaler logs several lines per simulation step, so buffer the records and write them to the file in
+        # batches. The file is only opened on the first flush, and `close` writes what is left at the end of a run.
+        self._log_file_handler = logging.FileHandler(log_file, delay=True)
+        self._log_handler = logging.handlers.MemoryHandler(capacity=LOG_BUFFER_RECORDS, target=self._log_file_handler)
+        scaler_id = id(self)
+        self._log_handler.addFilter(lambda record: getattr(record, "scaler_id", None) == scaler_id)
+        logger.addHandler(self._log_handler)
 
         # Write a test message to confirm logger is initialized
         self.logger.info(">>>SimulatedInfraScaler initialized")
@@ -112,26 +133,22 @@ class SimulatedInfraScaler:
         Returns:
             bool: Returns True if scaling was performed, False if no scaling occurred due to the recovery time.
         """
-        minutes = time_now.minute
         current_cpu_limit = self.cluster_state_provider.get_current_cpu_limit()
 
         # Only scale if the new limit differs from the current CPU limit
         if new_limit != current_cpu_limit:
+            elapsed_seconds = None if self.last_scaling_time is None else (time_now - self.last_scaling_time).seconds
             # Perform scaling if enough recovery time has passed since the last scaling event
-            if self.last_scaling_time is None or (time_now - self.last_scaling_time).seconds > self.recovery_time * 60:
+            if elapsed_seconds is None or elapsed_seconds > self._recovery_seconds:
                 self.logger.info(">>>attempting to scale to %f cores from %f", new_limit, current_cpu_limit)
 
                 # Check if new_limit goes below minimum or above maximum CPU limits
-                if new_limit < self.cluster_state_provider.config.general_config["min_cpu_limit"]:
+                if new_limit < self._min_cpu_limit:
                     self.logger.info(">>>not scaling, would go below min cores")
-                    self.cluster_state_provider.set_cpu_limit(
-                        self.cluster_state_provider.config.general_config["min_cpu_limit"]
-                    )
+                    self.cluster_state_provider.set_cpu_limit(self._min_cpu_limit)
                     self.logger.info(">>>corrected to min cores")
-                elif new_limit > self.cluster_state_provider.config.general_config["max_cpu_limit"]:
-                    self.cluster_state_provider.set_cpu_limit(
-                        self.cluster_state_provider.config.general_config["max_cpu_limit"]
-                    )
+                elif new_limit > self._max_cpu_limit:
+                    self.cluster_state_provider.set_cpu_limit(self._max_cpu_limit)
                     self.logger.info(">>>corrected to max cores")
                 else:
                     self.cluster_state_provider.set_cpu_limit(new_limit)
@@ -143,19 +160,45 @@ class SimulatedInfraScaler:
                 return True
 
             # If recovery time has not passed, log the remaining time
-            elif self.last_scaling_time is not None:
-                self.logger.info(
-                    "Waiting to scale %d minutes, current minutes %d, new_limit: %f",
-                    self.recovery_time * 60 - (time_now - self.last_scaling_time).seconds // 60,
-                    minutes,
-                    new_limit,
-                )
+            self.logger.info(
+                "Waiting to scale %d minutes, current minutes %d, new_limit: %f",
+                (self._recovery_seconds - elapsed_seconds) // 60,
+                time_now.minute,
+                new_limit,
+            )
         else:
             # Log if no scaling action is necessary
             self.logger.info(
                 "Waiting to scale %d minutes, current minutes %d, decision of cores to add or subtract: %f",
                 0,
-                minutes,
+                time_now.minute,
                 new_limit,
             )
         return False
+
+    def close(self):
+        """
+        Write the buffered log records to the update log and close it.
+
+        The simulator calls this at the end of a run, so the update log is complete even if the process exits
+        without shutting down logging, e.g. in a worker process. Records logged after this are dropped. Calling it
+        again does nothing.
+        """
+        handler, self._log_handler = self._log_handler, None
+        if handler is None:
+            return
+        logger.removeHandler(handler)
+        try:
+            handler.close()
+        finally:
+            self._log_file_handler.close()
+
+    def __del__(self):
+        """Release the update log of a scaler that was never closed, e.g. one that was built but never run."""
+        if getattr(self, "_log_handler", None) is None:
+            return
+        try:
+            self.close()
+        except OSError:
+            # The output directory may already be gone; the buffered records are dropped then
+            pass
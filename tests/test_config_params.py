@@ -33,6 +33,14 @@ Test Methods:
         Tests that the lag parameter is correctly applied when set to 5 minutes using an alternative
         configuration file. It ensures that the decisions in the simulation reflect the correct lag timing.
 
+    test_load_config_returns_independent_copies():
+        Tests that loading the same configuration file twice returns configurations that do not share
+        state, even though the parsed file is cached.
+
+    test_decisions_written_when_progress_run_stops_early():
+        Tests that the decisions made so far are written to the decisions file when the caller stops
+        iterating over `run_simulation_with_progress` before the simulation ends.
+
     tearDown():
         Cleans up by removing the temporary directories and files created during the test setup and execution.
 
@@ -181,6 +189,32 @@ class TestRunnerSimulatorIntegrationTest(unittest.TestCase):
             diff = (third_time - second_time).total_seconds() / 60
             assert diff == lag_read_in, f"Expected the difference lines 2-3 to be {lag_read_in} minutes, but got {diff}"
 
+    def test_load_config_returns_independent_copies(self):
+        """Configurations loaded from the same file must not share state, since simulations mutate them."""
+        config_path = f"{self.target_dir}/metadata_alt_config_lag.json"
+        first = InMemoryRunnerSimulator._load_config(config_path)  # pylint: disable=protected-access
+        first["general_config"]["lag"] = 42
+        second = InMemoryRunnerSimulator._load_config(config_path)  # pylint: disable=protected-access
+        assert second["general_config"]["lag"] == 5, "A mutation of one loaded config leaked into the cache"
+
+    def test_decisions_written_when_progress_run_stops_early(self):
+        """Closing the progress generator early still writes the decisions made so far."""
+        runner = InMemoryRunnerSimulator(
+            self.target_dir,
+            initial_cpu_limit=14,
+            algorithm="additive",
+            config_path=f"{self.target_dir}/metadata_alt_config_lag.json",
+        )
+        progress = runner.run_simulation_with_progress()
+        for _ in range(3):
+            next(progress)
+        progress.close()
+
+        with open(runner.out_filename, "r", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["LATEST_TIME", "CURR_LIMIT", "NEW_LIMIT"]
+        assert 0 < len(rows) - 1 <= 3, f"Expected at most 3 decisions, got {len(rows) - 1}"
+
     def tearDown(self):
         shutil.rmtree(self.target_dir_sim, ignore_errors=True)
         shutil.rmtree(self.target_dir, ignore_errors=True)
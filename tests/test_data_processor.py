@@ -42,10 +42,16 @@ Test Methods:
     test_resample_dataframe():
         Tests the `resample_dataframe` method to ensure data is resampled to the correct frequency.
 
+    test_resample_dataframe_max():
+        Tests `resample_dataframe` with a per-bin maximum instead of the default mean.
+
     test_get_workload_duration():
         Tests the `get_workload_duration` method to calculate the duration of a workload based
         on the input DataFrame's time range.
 
+    test_get_workload_duration_sorted():
+        Tests `get_workload_duration` on unsorted input and with the `assume_sorted` shortcut.
+
 Usage:
     These tests can be run using `unittest.main()` to verify that the `DataProcessor` class's
     data processing and time series methods work as expected.
@@ -107,11 +113,20 @@ class TestDataProcessor(unittest.TestCase):
         self.assertEqual(27.5, resampled["value"].iloc[1])
         self.assertEqual(15.0, resampled["value"].iloc[2])
 
+    def test_resample_dataframe_max(self):
+        resampled = DataProcessor.resample_dataframe(self.data, freq="2T", agg="max")
+        self.assertEqual([20.0, 30.0, 15.0], resampled["value"].tolist())
+
     def test_get_workload_duration(self):
         duration = DataProcessor.get_workload_duration(self.data)
         expected_duration = timedelta(minutes=4)
         self.assertEqual(duration, expected_duration)
 
+    def test_get_workload_duration_sorted(self):
+        shuffled = self.data.iloc[[2, 0, 4, 1, 3]]
+        self.assertEqual(timedelta(minutes=4), DataProcessor.get_workload_duration(shuffled))
+        self.assertEqual(timedelta(minutes=4), DataProcessor.get_workload_duration(self.data, assume_sorted=True))
+
 
 if __name__ == "__main__":
     unittest.main()
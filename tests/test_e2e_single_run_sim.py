@@ -36,6 +36,14 @@ Test Methods:
         Tests the simulator's behavior when using the "additive" scaling algorithm, validating
         the results against expected metrics such as slack, CPU usage, and number of scalings.
 
+    test_decisions_file_format():
+        Tests that the buffered decisions are written as text with the sub-second part of the timestamps kept and
+        a missing limit written as `None`.
+
+    test_back_to_back_runs():
+        Tests that a simulation succeeds after the output directories of earlier runners in the same process were
+        deleted, i.e. that the loggers of those runners do not keep writing into them.
+
     tearDown():
         Cleans up the temporary directories and files created during the test.
 
@@ -50,6 +58,8 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
+
 from vasim.simulator.InMemorySimulator import InMemoryRunnerSimulator
 
 
@@ -185,6 +195,33 @@ class TestRunnerSimulatorIntegrationTest(unittest.TestCase):
         )
         self.assertAlmostEqual(results["slack_percentage"], expected["slack_percentage"], places=2)
 
+    def test_decisions_file_format(self):
+        """Test that the decisions file keeps the text format of the recorded values."""
+        runner = InMemoryRunnerSimulator(self.target_dir, initial_cpu_limit=14, algorithm="additive")
+        runner.output_decision(pd.Timestamp("2023-04-02 00:09:00.250000"), 14, 12.5)
+        runner.output_decision(pd.Timestamp("2023-04-02 00:10:00"), 12.5, None)
+        runner.output_decision(None, 12.5, 13)
+        runner._finalize_decisions()  # pylint: disable=protected-access
+
+        with open(runner.out_filename, encoding="utf-8") as f:
+            content = f.read()
+        self.assertEqual(
+            content,
+            "LATEST_TIME,CURR_LIMIT,NEW_LIMIT\n2023-04-02 00:09:00.250000,14,12.5\n2023-04-02 00:10:00,12.5,None\n",
+        )
+
+    def test_back_to_back_runs(self):
+        """Test that a run does not depend on the output directory of an earlier run in the same process."""
+        first = InMemoryRunnerSimulator(self.target_dir, initial_cpu_limit=14, algorithm="additive")
+        self.assertIsNotNone(first.run_simulation())
+        # A runner that is set up but never run has not written its update log yet
+        InMemoryRunnerSimulator(self.target_dir, initial_cpu_limit=14, algorithm="additive")
+        shutil.rmtree(self.target_dir_sim)
+
+        second = InMemoryRunnerSimulator(self.target_dir, initial_cpu_limit=14, algorithm="multiplicative")
+        self.assertIsNotNone(second.run_simulation())
+        self.assertTrue(os.path.exists(os.path.join(second.target_simulation_dir, "updatelog.txt")))
+
     def tearDown(self):
         shutil.rmtree(self.target_dir_sim, ignore_errors=True)
         shutil.rmtree(self.target_dir, ignore_errors=True)
@@ -31,6 +31,31 @@ Test Methods:
         Tests the `read_metrics_data` method to ensure that the correct window of data
         is returned for processing.
 
+    test_read_metrics_data_precomputed_windows():
+        Tests that the window bounds precomputed by `precompute_windows` select the same data as
+        slicing the recorded data by time.
+
+    test_unsorted_data_is_sorted():
+        Tests that performance data stored out of order is sorted by time when the provider loads it, and that
+        the start and end times are the bounds of the data.
+
+    test_slice_by_time():
+        Tests that `_slice_by_time` selects the same data as slicing the recorded data by label, including
+        ranges that start or end outside of the data.
+
+    test_flush_metrics_data_parquet():
+        Tests that `flush_metrics_data_parquet` writes the recorded data with the same columns and
+        values as the CSV output. Skipped when no Parquet engine is installed.
+
+    test_factory_shares_recorded_data():
+        Tests that the providers created by `SimulatedClusterStateProviderFactory` reuse the cached performance
+        data, that setting up a provider leaves the cached data unchanged and that the factory does not also
+        keep the files in the per-file parse cache.
+
+    test_factory_reloads_changed_files():
+        Tests that a new factory reads the data again when a CSV file is added with an older modification time
+        or removed.
+
     test_get_next_recorded_data():
         Tests the `get_next_recorded_data` method to validate that the returned data is
         correctly processed within the time window and duplicates are removed.
@@ -47,6 +72,7 @@ Usage:
     `SimulatedInMemoryPredictiveClusterStateProvider` and related functionality.
 """
 
+import importlib.util
 import os
 import shutil
 import unittest
@@ -61,8 +87,12 @@ from vasim.recommender.cluster_state_provider.ClusterStateConfig import (
 )
 from vasim.recommender.cluster_state_provider.FileClusterStateProvider import (
     FileClusterStateProvider,
+    _read_perf_event_log,
 )
 from vasim.simulator.InMemorySimulator import InMemoryRunnerSimulator
+from vasim.simulator.SimulatedClusterStateProviderFactory import (
+    SimulatedClusterStateProviderFactory,
+)
 from vasim.simulator.SimulatedInMemoryPredictiveClusterStateProvider import (
     SimulatedInMemoryPredictiveClusterStateProvider,
 )
@@ -153,6 +183,151 @@ class TestSimulatedInMemoryPredictiveClusterStateProvider(unittest.TestCase):
         type(result)
         self.assertEqual(result["cpu"].values.tolist(), expected_result["cpu"].values.tolist())
 
+    def test_read_metrics_data_precomputed_windows(self):
+        """Test that the precomputed window bounds select the same data as slicing by time."""
+
+        sim_inmem_p_prov = SimulatedInMemoryPredictiveClusterStateProvider(
+            window=40,
+            lag=10,
+            data_dir=self.target_dir,
+            decision_file_path=self.target_dir / "decisions.csv",
+            max_cpu_limit=14,
+            config=self.config,
+            prediction_config=self.config.prediction_config,
+            general_config=self.config.general_config,
+        )
+        start_time = sim_inmem_p_prov.current_time
+
+        expected = []
+        for _ in range(5):
+            expected.append((sim_inmem_p_prov.read_metrics_data(), sim_inmem_p_prov._get_all_performance_data()))
+            sim_inmem_p_prov.advance_time()
+
+        sim_inmem_p_prov.current_time = start_time
+        sim_inmem_p_prov.precompute_windows()
+        for expected_window, expected_history in expected:
+            pd.testing.assert_frame_equal(expected_window, sim_inmem_p_prov.read_metrics_data())
+            pd.testing.assert_frame_equal(expected_history, sim_inmem_p_prov._get_all_performance_data())
+            sim_inmem_p_prov.advance_time()
+
+    def test_unsorted_data_is_sorted(self):
+        """Test that recorded data read out of order is sorted by time once at load time."""
+
+        csv_path = next(self.target_dir.glob("*perf_event_log.csv"))
+        rows = pd.read_csv(csv_path)
+        rows.sample(frac=1, random_state=0).to_csv(csv_path, index=False)
+
+        sim_inmem_p_prov = SimulatedInMemoryPredictiveClusterStateProvider(
+            window=40,
+            lag=10,
+            data_dir=self.target_dir,
+            decision_file_path=self.target_dir / "decisions.csv",
+            max_cpu_limit=14,
+            config=self.config,
+            prediction_config=self.config.prediction_config,
+            general_config=self.config.general_config,
+        )
+
+        self.assertTrue(sim_inmem_p_prov.recorded_data.index.is_monotonic_increasing)
+        self.assertEqual(sim_inmem_p_prov.start_time, sim_inmem_p_prov.recorded_data.index.min())
+        self.assertEqual(sim_inmem_p_prov.end_time, sim_inmem_p_prov.recorded_data.index.max())
+        self.assertEqual(len(sim_inmem_p_prov.recorded_data), len(rows))
+
+    def test_slice_by_time(self):
+        """Test that slicing by time with searchsorted matches label slicing, including ranges beyond the data."""
+
+        sim_inmem_p_prov = SimulatedInMemoryPredictiveClusterStateProvider(
+            window=40,
+            lag=10,
+            data_dir=self.target_dir,
+            decision_file_path=self.target_dir / "decisions.csv",
+            max_cpu_limit=14,
+            config=self.config,
+            prediction_config=self.config.prediction_config,
+            general_config=self.config.general_config,
+        )
+        start_time = sim_inmem_p_prov.start_time
+        end_time = sim_inmem_p_prov.end_time
+        ranges = [
+            (start_time, start_time),
+            (start_time + pd.Timedelta(minutes=7), start_time + pd.Timedelta(minutes=47)),
+            (start_time + pd.Timedelta(seconds=30), start_time + pd.Timedelta(minutes=90, seconds=30)),
+            (start_time - pd.Timedelta(days=1), start_time + pd.Timedelta(minutes=20)),
+            (end_time - pd.Timedelta(minutes=20), end_time + pd.Timedelta(days=1)),
+            (end_time + pd.Timedelta(minutes=1), end_time + pd.Timedelta(minutes=2)),
+        ]
+
+        for range_start, range_end in ranges:
+            pd.testing.assert_frame_equal(
+                sim_inmem_p_prov.recorded_data.loc[range_start:range_end],
+                sim_inmem_p_prov._slice_by_time(range_start, range_end),
+            )
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow") or importlib.util.find_spec("fastparquet"), "no Parquet engine installed"
+    )
+    def test_flush_metrics_data_parquet(self):
+        """Test that the Parquet output holds the same data as the CSV output."""
+
+        sim_inmem_p_prov = SimulatedInMemoryPredictiveClusterStateProvider(
+            window=40,
+            lag=10,
+            data_dir=self.target_dir,
+            decision_file_path=self.target_dir / "decisions.csv",
+            max_cpu_limit=14,
+            config=self.config,
+            prediction_config=self.config.prediction_config,
+            general_config=self.config.general_config,
+        )
+        csv_path = self.target_dir / "flushed_perf_event_log.csv"
+        parquet_path = self.target_dir / "flushed_perf_event_log.parquet"
+        sim_inmem_p_prov.flush_metrics_data(csv_path)
+        sim_inmem_p_prov.flush_metrics_data_parquet(parquet_path)
+
+        from_csv = pd.read_csv(csv_path)
+        from_csv["TIMESTAMP"] = pd.to_datetime(from_csv["TIMESTAMP"], format="%Y.%m.%d-%H:%M:%S:%f")
+        pd.testing.assert_frame_equal(from_csv, pd.read_parquet(parquet_path), check_dtype=False)
+
+    def test_factory_shares_recorded_data(self):
+        """Test that providers created by the factory share the cached data without modifying it."""
+
+        factory = SimulatedClusterStateProviderFactory(
+            data_dir=self.target_dir, out_filename=self.target_dir / "decisions.csv", config=self.config
+        )
+        lookups = _read_perf_event_log.cache_info()
+        cached = factory.recorded_data
+        after = _read_perf_event_log.cache_info()
+        self.assertEqual((after.hits, after.misses), (lookups.hits, lookups.misses))
+        expected = cached.copy()
+
+        first = factory.create_provider(predictive=True)
+        second = factory.create_provider(predictive=True)
+
+        self.assertIs(cached, factory.recorded_data)
+        pd.testing.assert_frame_equal(first.recorded_data, second.recorded_data)
+        pd.testing.assert_frame_equal(cached, expected)
+        self.assertEqual(first.recorded_data.index.name, "timeindex")
+
+    def test_factory_reloads_changed_files(self):
+        """Test that the cached data follows files that are added with an older mtime or removed."""
+
+        def make_factory():
+            return SimulatedClusterStateProviderFactory(
+                data_dir=self.target_dir, out_filename=self.target_dir / "decisions.csv", config=self.config
+            )
+
+        num_rows = len(make_factory().recorded_data)
+
+        source = self.target_dir / "c_29247_perf_event_log.csv"
+        added = self.target_dir / "b_29247_perf_event_log.csv"
+        shutil.copyfile(source, added)
+        # Older than the existing file, so a key on the newest modification time alone would not notice it
+        os.utime(added, ns=(0, 0))
+        self.assertEqual(len(make_factory().recorded_data), 2 * num_rows)
+
+        added.unlink()
+        self.assertEqual(len(make_factory().recorded_data), num_rows)
+
     def test_get_next_recorded_data(self):
         """Test the read_metrics_data method, which is the window of data to process next."""
 
@@ -0,0 +1,172 @@
+#
+# --------------------------------------------------------------------------
+#  Licensed under the MIT License. See LICENSE file in the project root for
+#  license information.
+#  Copyright (c) Microsoft Corporation.
+# --------------------------------------------------------------------------
+#
+
+"""
+Module Name: TestCreateModifiedConfigs.
+
+Description:
+    This module contains unit tests for `_create_modified_configs` in `ParameterTuning`, which generates the
+    configurations of a tuning sweep from a base configuration. The generated configurations are shallow copies
+    of the base with new section dicts, so these tests check that no state is shared between them.
+
+Classes:
+    TestCreateModifiedConfigs:
+        A test class that extends `unittest.TestCase` and validates the configurations generated by the
+        grid and random strategies.
+
+Test Methods:
+    setUp():
+        Creates the base configuration used by the tests.
+
+    test_grid_order():
+        Tests that the grid strategy generates every combination, nesting algorithm-specific, general and
+        predictive parameters in that order.
+
+    test_base_config_unchanged():
+        Tests that generating configurations leaves the sections of the base configuration untouched.
+
+    test_configs_do_not_share_sections():
+        Tests that mutating a section of one generated configuration affects neither the base nor the
+        other generated configurations.
+
+    test_random_reproducible():
+        Tests that the random strategy draws the same configurations on every call.
+
+    test_sobol_covers_values():
+        Tests that the sobol strategy is reproducible and spreads a small number of samples over all the values
+        of a parameter.
+
+    test_invalid_strategy():
+        Tests that an unknown strategy raises a `ValueError`.
+
+    test_grid_larger_than_max_combinations():
+        Tests that `tune_with_strategy` rejects a grid larger than `max_combinations` before running it.
+
+    test_sweep_id_stable():
+        Tests that the sweep id is the same for the same sweep and changes with the tuned parameters.
+
+Usage:
+    Run the tests using `unittest.main()` to verify the configurations generated for tuning sweeps.
+"""
+
+import copy
+import os
+import unittest
+from pathlib import Path
+
+from vasim.recommender.cluster_state_provider.ClusterStateConfig import (
+    ClusterStateConfig,
+)
+from vasim.simulator.ParameterTuning import (
+    _create_modified_configs,
+    _create_sweep_id,
+    tune_with_strategy,
+)
+
+
+class TestCreateModifiedConfigs(unittest.TestCase):
+    def setUp(self):
+        self.baseconfig = ClusterStateConfig(
+            config_dict={
+                "general_config": {"window": 60, "lag": 10},
+                "algo_specific_config": {"addend": 2},
+                "prediction_config": {"enabled": True, "waiting_before_predict": 1440},
+            }
+        )
+
+    def test_grid_order(self):
+        configs = _create_modified_configs(
+            self.baseconfig, {"addend": [1, 3]}, {"window": [60, 120]}, {"waiting_before_predict": [60]}, "grid", 0
+        )
+
+        combinations = [(c.algo_specific_config["addend"], c.general_config["window"]) for c in configs]
+        self.assertEqual(combinations, [(1, 60), (1, 120), (3, 60), (3, 120)])
+        self.assertTrue(all(c.prediction_config["waiting_before_predict"] == 60 for c in configs))
+        # Parameters that are not tuned keep their base values
+        self.assertTrue(all(c.general_config["lag"] == 10 for c in configs))
+
+    def test_base_config_unchanged(self):
+        sections = {
+            "general_config": copy.deepcopy(self.baseconfig.general_config),
+            "algo_specific_config": copy.deepcopy(self.baseconfig.algo_specific_config),
+            "prediction_config": copy.deepcopy(self.baseconfig.prediction_config),
+        }
+
+        _create_modified_configs(
+            self.baseconfig, {"addend": [1, 3]}, {"window": [120]}, {"waiting_before_predict": [60]}, "grid", 0
+        )
+
+        for section, expected in sections.items():
+            self.assertEqual(self.baseconfig[section], expected)
+
+    def test_configs_do_not_share_sections(self):
+        configs = _create_modified_configs(self.baseconfig, {"addend": [1, 3]}, {}, {}, "grid", 0)
+
+        configs[0].general_config["lag"] = 99
+        configs[0].prediction_config["enabled"] = False
+
+        self.assertEqual(configs[1].general_config["lag"], 10)
+        self.assertTrue(configs[1].prediction_config["enabled"])
+        self.assertEqual(self.baseconfig.general_config["lag"], 10)
+        self.assertTrue(self.baseconfig.prediction_config["enabled"])
+
+    def test_random_reproducible(self):
+        params = ({"addend": [1, 3, 5, 10]}, {"window": [60, 120, 240]}, {"waiting_before_predict": [60, 1440]})
+
+        first = _create_modified_configs(self.baseconfig, *params, "random", 6)
+        second = _create_modified_configs(self.baseconfig, *params, "random", 6)
+
+        self.assertEqual(len(first), 6)
+        self.assertEqual(
+            [(c.algo_specific_config, c.general_config, c.prediction_config) for c in first],
+            [(c.algo_specific_config, c.general_config, c.prediction_config) for c in second],
+        )
+
+    def test_sobol_covers_values(self):
+        params = ({"addend": [1, 3, 5, 10]}, {"window": [60, 120]}, {})
+
+        first = _create_modified_configs(self.baseconfig, *params, "sobol", 4)
+        second = _create_modified_configs(self.baseconfig, *params, "sobol", 4)
+
+        addends = [c.algo_specific_config["addend"] for c in first]
+        self.assertEqual(sorted(addends), [1, 3, 5, 10])
+        self.assertEqual(addends, [c.algo_specific_config["addend"] for c in second])
+        self.assertTrue(all(c.general_config["window"] in (60, 120) for c in first))
+
+    def test_invalid_strategy(self):
+        with self.assertRaises(ValueError):
+            _create_modified_configs(self.baseconfig, {}, {}, {}, "unknown", 0)
+
+    def test_grid_larger_than_max_combinations(self):
+        root_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+        config_path = root_dir / "test_data/alibaba_control_c_29247_denom_1_mini/metadata.json"
+
+        with self.assertRaises(ValueError):
+            tune_with_strategy(
+                config_path,
+                "grid",
+                data_dir=root_dir / "test_data/alibaba_control_c_29247_denom_1_mini",
+                algo_specific_params_to_tune={"addend": [1, 3, 5]},
+                general_params_to_tune={"window": [60, 120]},
+                max_combinations=5,
+            )
+
+    def test_sweep_id_stable(self):
+        params = ({"addend": [1, 3]}, {"window": [60, 120]}, {})
+
+        sweep_id = _create_sweep_id(self.baseconfig, params, "grid", 10, "additive", 4)
+
+        self.assertEqual(len(sweep_id), 8)
+        self.assertEqual(sweep_id, _create_sweep_id(copy.deepcopy(self.baseconfig), params, "grid", 10, "additive", 4))
+        self.assertNotEqual(
+            sweep_id, _create_sweep_id(self.baseconfig, params[:2] + ({"lag": [5]},), "grid", 10, "additive", 4)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
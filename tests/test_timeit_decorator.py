@@ -10,7 +10,7 @@
 Module Name: TestTimeitDecorator.
 
 Description:
-    This module contains unit tests for the `timeit` decorator, which measures and prints the
+    This module contains unit tests for the `timeit` decorator, which measures and logs the
     execution time of a function. The tests validate that the `timeit` decorator correctly
     measures the time taken by various functions with different input parameters and ensures
     the original function's return values and behavior are preserved.
@@ -35,6 +35,9 @@ Test Methods:
     test_timeit_decorator_with_keyword_arguments():
         Verifies that the `timeit` decorator works correctly with functions that take keyword arguments.
 
+    test_timeit_decorator_logs_at_debug_level():
+        Verifies that the `timeit` decorator reports the execution time through the module logger at DEBUG level.
+
 Usage:
     These tests can be run using `unittest.main()` to execute the unit tests for the `timeit`
     decorator, validating its behavior across different function signatures and scenarios.
@@ -115,6 +118,23 @@ class TestTimeitDecorator(unittest.TestCase):
         result = sample_function(2, y=3)
         self.assertEqual(result, 5)
 
+    def test_timeit_decorator_logs_at_debug_level(self):
+        """
+        Test that the `timeit` decorator logs the execution time at DEBUG level.
+
+        This test ensures that the timing is emitted through the module logger rather than printed.
+        """
+
+        @timeit
+        def sample_function():
+            return "done"
+
+        with self.assertLogs("vasim.recommender.forecasting.utils.helpers", level="DEBUG") as captured:
+            result = sample_function()
+        self.assertEqual(result, "done")
+        self.assertEqual(1, len(captured.records))
+        self.assertIn("sample_function execution time", captured.output[0])
+
 
 if __name__ == "__main__":
     unittest.main()